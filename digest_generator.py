@@ -25,21 +25,44 @@ KJS 2025-11-17 Added <hr> elements around h2 elements to set them off for longer
 import csv
 import sys
 import requests
-import feedparser
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
 import re
-from bs4 import BeautifulSoup
-import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
+import numpy as np
+# pandas and feedparser are imported where they are used (reading article CSV files, parsing RSS feeds),
+# so runs that don't need them (e.g. -h, or -ra without fetching) don't pay for loading them
 import os
 import random
+import importlib.util
 
 # Added 2025-11-13 KJS
 import argparse
 import time
 import traceback
 import json
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from urllib.parse import urlsplit
+from functools import lru_cache
+import sqlite3
+from html import unescape
+
+# Use the much faster lxml parser with BeautifulSoup when it is installed; otherwise fall back to Python's built-in parser
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# If numba is installed, compile the scoring arithmetic into a single fused loop; otherwise numpy does it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Likewise, use orjson for reading and saving JSON when it is installed (much faster than the json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ################################################################################
 ''' Default settings used for runstring and for interactive '''
@@ -58,8 +81,19 @@ DEFAULT_PER_AUTHOR=0;      MAX_PER_AUTHOR=20  # each RSS file seems to max out a
 API_CALL_TIMEOUT=10           # KJS 2025-11-24 original value, parameterized
 API_INITIAL_RETRY_DELAY=2.0   # KJS 2025-11-18 Wait 2 sec initially, instead of 1, if a timeout
 API_RETRY_RAMPUP = 2.0        # double the delay time on subsequent retries (2, then 4, then 9, ...)
-API_PERIODIC_DELAY = 5.0      # wait 5 sec every so many API calls, regardless of retries
+API_RETRY_JITTER = 0.5        # up to 0.5 sec extra (random) on each retry delay, so threads that failed together don't retry together
+API_HOST_RATE = 5.0           # requests per second to any one host (all of *.substack.com counts as one), to avoid 429 errors
+API_HOST_BURST = 5            # requests a host can get right away before API_HOST_RATE pacing starts
+ARTICLE_PAGE_MAX_BYTES = 1<<20  # read at most this much of an article page for its engagement metrics (unless saving temp files)
+SECONDS_PER_DAY = 24*60*60
+PUBLISHED_UTC_FORMAT = '%Y-%m-%d %H:%M %Z'  # publication date as shown in the digest and the CSV 'UTC Date' column
 MAX_RAW_SCORE = 100.0         # where we currently cap raw scores (TO DO: add a runstring parameter to allow changing this)
+API_CACHE_TTL = 6*60*60       # seconds to reuse an API response cached in the temp folder before asking Substack again
+API_CACHE_FILENAME = "_api_cache.sqlite"  # response cache database, kept in the temp folder (if any)
+API_CACHE_MAX_AGE = 4*API_CACHE_TTL  # seconds before a cached response that hasn't been used or rechecked is deleted
+TEMP_FILE_WRITER_THREADS = 4  # background threads for saving HTML and JSON files to the temp folder
+NEWSLETTER_FETCH_THREADS = 4  # newsletters fetched at the same time (kept small to stay polite to Substack)
+OUTPUT_WRITE_BUFFER_SIZE = 1<<20  # bytes of file buffer when streaming the digest HTML and CSV files out
 
 # Writer	Date Published	UTC Date	Category	Authors	Article Title	Article URL	Article Link	Newsletter Name	Newsletter URL	Newsletter Link	Writer Name	Writer Handle	Summary	Words	Likes	Comments	Restacks	Raw Score	Score
 
@@ -67,11 +101,17 @@ articles_columns=['Writer Name','Writer Handle','Publisher',
                 'Article Title','Article URL','Newsletter Name','Newsletter URL',
                 'Authors','Category','Date Published']
 
-DEBUG_COLUMNS=['Writer','Date Published','UTC Date','Category','Authors',
+OUTPUT_COLUMNS=['Writer','Date Published','UTC Date','Category','Authors',
                'Article Title','Article URL','Article Link','Newsletter Name',
                'Newsletter URL','Newsletter Link','Writer Name','Writer Handle',
-               'Summary','Words','Likes','Comments','Restacks','Raw Score','Score',
-               'Type']
+               'Summary','Words','Likes','Comments','Restacks','Raw Score','Score']
+
+DEBUG_COLUMNS=OUTPUT_COLUMNS+['Type']
+
+# Columns read back (in this order) when reusing article data from a CSV file
+CSV_READ_COLUMNS=articles_columns+['Summary','Words','Likes','Comments','Restacks','Raw Score','Score']
+# Text columns among those, cleaned up (stripped, blanks as '') in one pass before the rows are read
+CSV_TEXT_COLUMNS=[col for col in articles_columns if col!='Date Published']+['Summary']
 
 VERBOSE_DEFAULT=False
 INTERACTIVE_DEFAULT=False
@@ -100,6 +140,61 @@ CATEGORY_ARTICLE_ICON=""
 
 DG_VERSION="1.0.4 2025-12-15T0438" 
 
+# Patterns applied to every article we fetch; compile them once here instead of on each call
+SLUG_RE = re.compile(r'/p/([^/?\#]+)')          # post slug in https://newsletter.substack.com/p/slug-here
+BASE_URL_RE = re.compile(r'(https?://[^/]+)')     # scheme and host of an article link
+ENGAGEMENT_LABEL_RE = re.compile(r'(Like|View comments|Restack) \((\d+)\)')  # aria-labels on the Like, comments, and Restack buttons
+ENGAGEMENT_LABEL_FIELDS = {'Like': 'reaction_count', 'View comments': 'comment_count', 'Restack': 'restack_count'}
+
+# The engagement metrics on an article page are only in <meta> and <button> tags, so don't build the rest of the page
+ENGAGEMENT_STRAINER = SoupStrainer(['meta', 'button'])
+
+# RSS summaries are short, simple HTML; stripping tags with a regex is much cheaper than building a soup for each one.
+# A tag starts with a name and may have quoted attribute values containing '>' or '<'. Anything else that starts
+# with '<' (CDATA, <!DOCTYPE>, stray quotes, a bare '<' in text) is left in place for BeautifulSoup to handle.
+TAG_REST = r'''(?:[^<>"'=]|=\s*"[^"]*"|=\s*'[^']*'|=)*>'''  # a tag's attributes and closing '>'
+TAG_RE = re.compile(rf'</?[A-Za-z]{TAG_REST}')
+# Elements whose contents aren't text (feedparser's sanitizer used to drop script, style and applet from the RSS HTML for us)
+NON_TEXT_TAGS = ['script', 'style', 'template', 'applet']
+# A block can't hold the same tag again or another end tag, since those change where BeautifulSoup ends the element
+NON_TEXT_RE = re.compile(rf'<({"|".join(NON_TEXT_TAGS)})\b(?:(?!<\1\b|</(?!\1\b)).)*?</\1\s*>|<!--.*?-->', re.DOTALL | re.IGNORECASE)
+# A non-text tag left over once the blocks are gone (unclosed, nested or stray) means BeautifulSoup would drop a
+# different stretch of text than the regex; keep its '<' (the 'stray' group) so the text goes to BeautifulSoup instead
+STRAY_NON_TEXT_TAG = rf'(?P<stray><)/?(?:{"|".join(NON_TEXT_TAGS)})\b{TAG_REST}'
+# All in one left-to-right pass, so removing a <style> block can't join a stray '<' to the text after it to look like a tag
+MARKUP_RE = re.compile(f'{NON_TEXT_RE.pattern}|{STRAY_NON_TEXT_TAG}|{TAG_RE.pattern}', re.DOTALL | re.IGNORECASE)
+KEEP_WHITESPACE_RE = re.compile(r'<(pre|textarea)\b', re.IGNORECASE)  # BeautifulSoup keeps all whitespace inside these
+HTML_SPACES = ' \n\t\f\r'  # the whitespace BeautifulSoup collapses in whitespace-only strings
+
+MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')  # '[title](link)'
+
+# Fixed HTML fragments for the digest, filled in with str.format() when the digest is generated
+DIGEST_CONTAINER_DIV='<div style="font-family: Georgia, serif; max-width: 700px; margin: 0 auto; line-height: 1.7; color: #1a1a1a;">'
+DIGEST_HEADER_TEMPLATE='''
+        <div style="text-align: center; padding: 40px 20px; margin-bottom: 40px;">
+            <h1 style="font-size: 36px; font-weight: 700; color: #1a1a1a; margin: 0 0 10px 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;">Newsletter Digest</h1>
+            <div style="font-size: 16px; color: #666; margin-bottom: 8px;">{date}</div>
+            <div style="font-size: 14px; color: #666; margin-bottom: 8px;">{collab_text}{featured_count} Featured Articles {wildcard_text}• {total_count} Total Articles</div>
+            <div style="font-size: 13px; color: #888; font-style: italic;">{scoring_label} scoring (engagement + length) {norm_text}<br>{lookback_text} • {newsletter_count} newsletters</div>
+        </div>
+        '''
+# KJS 2025-11-16 Inline styles for article headers (consider adding id={id} so we can add clickable TOC later? or use collapsible sections instead, since neither will work in Substack)
+H2_TEMPLATE='<br> <hr><h2 style="font-size: 24px; font-weight: 700; color: #1a1a1a; margin: 0 0 0 0; font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;" title="{collapse_text}">{heading}</h2><hr style="margin-bottom: 10px">'
+# Adding spacing before and after H2 with <p> or <div> or <br> or style padding & margin works well in a normal browser.
+# But Substack ignores padding & margin and does not respect the spacing before or after the end of the H2 with any of 
+# these methods. Haven't yet found a way to make it work well. Will keep experimenting.
+
+# Style definitions for the lines of each article, shared among featured/wildcard and compact articles
+ARTICLE_LINE0_STYLE_START='<span style="font-size: 20px; font-weight: 700; line-height: 1.3; margin-bottom: 8px;">'
+ARTICLE_LINE0_STYLE_END='</span>'
+ARTICLE_TITLE_LINK_TEMPLATE='<a title="{title}" href="{link}" style="color: #1a1a1a; text-decoration: none;">{text}</a>'
+ARTICLE_LINE1_STYLE_START="<span style=\"margin-bottom: 40px; padding: 15px 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; font-size: 18px; color: #666; line-height: 1.6;\">"
+ARTICLE_LINE1_STYLE_END="</span>"
+ENGAGEMENT_STYLE_START='<span style="font-size: 16px; color: #666; line-height: 1.6;">'
+ENGAGEMENT_STYLE_END='</span>'
+EMPTY_ENGAGEMENT_HTML=ENGAGEMENT_STYLE_START+ENGAGEMENT_STYLE_END  # nothing to show: no category, metrics, words, or score
+BULLET_SEPARATOR=" • "
+
 ''' Markdown link utilities '''
 def get_from_markdown(md_string:str, verbose=VERBOSE_DEFAULT):
     """
@@ -110,8 +205,7 @@ def get_from_markdown(md_string:str, verbose=VERBOSE_DEFAULT):
     """
     try:
         # Text is in the pattern '[title](link)'
-        pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-        match = re.search(pattern, md_string)
+        match = MARKDOWN_LINK_RE.search(md_string)
         if match:
             title, link = match.groups()
             return title, link
@@ -134,16 +228,247 @@ def make_markdown_link(title:str, url:str):
         md_string=""
     return md_string
 
+''' HTTP utilities '''
+def read_response_start(response, max_bytes):
+    ''' Read up to max_bytes of a streamed response body, then close it (dropping the rest of a huge page) '''
+    chunks=[]; size=0
+    try:
+        for chunk in response.iter_content(chunk_size=64*1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes: break
+    finally:
+        response.close()
+    return b''.join(chunks)[:max_bytes]
+
+''' JSON utilities '''
+def json_loads(text):
+    ''' Parse JSON text with orjson if we have it, else with the json module '''
+    if orjson:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # the json module is more lenient (e.g. NaN, very large ints), so give it a try too
+    return json.loads(text)
+
+''' HTML text utilities '''
+def html_text(html_content):
+    ''' Text of an HTML fragment, as soup_text() gives it, without building a soup.
+    Returns None if the fragment has markup that only a real parser can sort out (e.g. a malformed tag or a bare '<'). '''
+    if KEEP_WHITESPACE_RE.search(html_content):
+        return None
+    strings = []
+    start = 0
+    for match in MARKUP_RE.finditer(html_content):
+        if match['stray']:
+            return None
+        strings.append(html_content[start:match.start()])
+        start = match.end()
+    strings.append(html_content[start:])
+
+    text_parts = []
+    for string in strings:
+        if not string:
+            continue
+        if '<' in string:
+            return None
+        string = unescape(string)
+        # Like BeautifulSoup, turn a whitespace-only string between tags into one newline (or one space)
+        if not string.strip(HTML_SPACES):
+            string = '\n' if '\n' in string else ' '
+        text_parts.append(string)
+    return ''.join(text_parts)
+
+def soup_text(html_content):
+    ''' Text of an HTML fragment from BeautifulSoup with Python's built-in parser, leaving out the NON_TEXT_TAGS elements '''
+    soup = BeautifulSoup(html_content, 'html.parser')
+    for tag in soup(NON_TEXT_TAGS):
+        tag.decompose()
+    return soup.get_text()
+
+''' Scoring arithmetic '''
+def score_arrays(reactions, comments, restacks, words, days_old, use_daily_average, normalize):
+    ''' Compute raw and final scores for arrays of article engagement data (see _score_articles for the model) '''
+    # Calculate engagement component
+    engagement_score = (reactions * LIKE_WEIGHT) + (comments * COMMENT_WEIGHT) + (restacks * RESTACK_WEIGHT)
+
+    # Apply daily average if requested
+    if use_daily_average:
+        engagement_score = engagement_score / days_old
+
+    # Calculate length component (ensures non-zero score)
+    # Word count contributes a small amount even with zero engagement
+    length_score = (words / 100) * LENGTH_WEIGHT
+
+    # Combine engagement + length
+    raw_scores = engagement_score + length_score
+
+    # Normalize scores to 1-100 range
+     # KJS 2025-11-16 handle outlier case (eg 400+) skewing all other scores low
+    min_score = min(raw_scores.min(),MAX_RAW_SCORE)
+    max_score = min(raw_scores.max(),MAX_RAW_SCORE) 
+
+    # Handle edge case where all scores are the same
+    score_range = max_score - min_score
+    if score_range == 0:
+        scores = np.full(len(raw_scores), MAX_RAW_SCORE/2.0)  # All get mid-range score
+    else:
+        # KJS 2025-11-22
+        # We may not actually want to normalize the top scores to MAX_RAW_SCORE if all are below MAX_RAW_SCORE.
+        # We might only want to cap articles exceeding MAX_RAW_SCORE so they don't ruin the curve as badly.
+        # Normalize to 1-MAX_RAW_SCORE range, or use the raw score but cap it
+        scores = np.minimum(raw_scores, MAX_RAW_SCORE)
+        if normalize:
+            scores = ((scores - min_score) / score_range) * 99.0 + 1.0
+    return raw_scores, scores
+
+def score_arrays_loop(reactions, comments, restacks, words, days_old, use_daily_average, normalize):
+    ''' Same arithmetic as score_arrays, written as plain loops for numba to compile '''
+    n = reactions.shape[0]
+    raw_scores = np.empty(n)
+    for i in range(n):
+        engagement_score = (reactions[i] * LIKE_WEIGHT) + (comments[i] * COMMENT_WEIGHT) + (restacks[i] * RESTACK_WEIGHT)
+        if use_daily_average:
+            engagement_score = engagement_score / days_old[i]
+        raw_scores[i] = engagement_score + (words[i] / 100) * LENGTH_WEIGHT
+
+    min_score = min(raw_scores.min(),MAX_RAW_SCORE)
+    max_score = min(raw_scores.max(),MAX_RAW_SCORE)
+    score_range = max_score - min_score
+    scores = np.empty(n)
+    for i in range(n):
+        if score_range == 0:
+            scores[i] = MAX_RAW_SCORE/2.0
+        else:
+            scores[i] = min(raw_scores[i],MAX_RAW_SCORE)
+            if normalize:
+                scores[i] = ((scores[i] - min_score) / score_range) * 99.0 + 1.0
+    return raw_scores, scores
+
+# No fastmath: the compiled loop must give exactly the same scores as numpy
+SCORE_ARRAYS = njit(cache=True)(score_arrays_loop) if njit else score_arrays
+
+class ThreadOutputCollector:
+    """Stands in for sys.stdout while newsletters are fetched on worker threads. Each worker's
+    progress output is collected separately, so it can be printed in newsletter order."""
+
+    def __init__(self, stream):
+        self.stream=stream
+        self.local=threading.local()
+
+    def start(self):
+        ''' Start collecting this thread's output '''
+        self.local.parts=[]
+
+    def finish(self):
+        ''' Stop collecting this thread's output and return it '''
+        parts=self.local.parts
+        self.local.parts=None
+        return ''.join(parts)
+
+    def write(self, text):
+        parts=getattr(self.local, 'parts', None)
+        if parts is None:
+            return self.stream.write(text)
+        parts.append(text)
+        return len(text)
+
+    def flush(self):
+        if getattr(self.local, 'parts', None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+class HostRateLimiter:
+    """Paces requests to each host with a token bucket, shared by the newsletter fetch threads"""
+
+    def __init__(self, rate=API_HOST_RATE, burst=API_HOST_BURST):
+        self.rate=rate
+        self.burst=burst
+        self.lock=threading.Lock()
+        self.buckets={}  # host -> (tokens left, time.monotonic() when last updated)
+
+    def host_key(self, url):
+        ''' Host to pace a URL by; Substack's own newsletter subdomains all count as one host '''
+        host = urlsplit(url).netloc.lower()
+        return 'substack.com' if host.endswith('.substack.com') else host
+
+    def wait(self, url):
+        ''' Wait until the host for this URL can take another request '''
+        host = self.host_key(url)
+        with self.lock:
+            now = time.monotonic()
+            tokens, updated = self.buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now-updated)*self.rate) - 1  # take ours now; below zero means wait for it
+            self.buckets[host] = (tokens, now)
+        if tokens < 0:
+            time.sleep(-tokens/self.rate)
+
 ''' Digest Generator '''
+class ResponseCache:
+    """Small on-disk cache of API and article page responses, so repeated runs don't refetch them"""
+
+    def __init__(self, db_path, ttl=API_CACHE_TTL, max_age=API_CACHE_MAX_AGE):
+        self.ttl=ttl
+        # Shared by the newsletter fetch threads, one query at a time
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, saved REAL, etag TEXT, body TEXT, last_modified TEXT)")
+            # Caches saved by earlier versions don't have the Last-Modified column yet
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(responses)")}
+            if 'last_modified' not in columns:
+                self.connection.execute("ALTER TABLE responses ADD COLUMN last_modified TEXT")
+            # Don't let the cache grow forever: drop responses no run has used (or rechecked) for a while
+            self.connection.execute("DELETE FROM responses WHERE saved < ?", (time.time()-max_age,))
+
+    def get(self, url):
+        ''' Return (saved time, ETag, body, Last-Modified) for a cached URL, or None if we don't have it '''
+        with self.lock:
+            return self.connection.execute("SELECT saved, etag, body, last_modified FROM responses WHERE url=?", (url,)).fetchone()
+
+    def is_fresh(self, saved):
+        ''' Check if a response saved at this time is recent enough to reuse without asking the server '''
+        return time.time()-saved < self.ttl
+
+    def put(self, url, etag, body, last_modified=None):
+        with self.lock:
+            self.connection.execute("INSERT OR REPLACE INTO responses (url, saved, etag, body, last_modified) VALUES (?, ?, ?, ?, ?)", (url, time.time(), etag, body, last_modified))
+
+    def touch(self, url):
+        ''' Server said our cached copy is still current (HTTP 304); restart its clock '''
+        with self.lock:
+            self.connection.execute("UPDATE responses SET saved=? WHERE url=?", (time.time(), url))
+
+    def commit(self):
+        ''' Save the changes since the last commit. put and touch don't commit each change, so a run's worth
+        of responses goes to disk in one transaction instead of one (with its disk sync) per response '''
+        with self.lock:
+            self.connection.commit()
+
+
 class DigestGenerator:
     """Standalone newsletter digest generator"""
 
-    def __init__(self, verbose=VERBOSE_DEFAULT, temp_folder=""):
+    def __init__(self, verbose=VERBOSE_DEFAULT, temp_folder="", random_seed=None):
         self.newsletters = []
+        self.newsletter_keys = set()  # (name, writer_name) of each newsletter in the list, for the duplicate check in _add_newsletter
         self.articles = []
+        self.newsletter_index = None  # lookups by name built from self.newsletters on first use; reset when one is added
 
         self.verbose=verbose
         self.temp_folder=temp_folder
+        self.response_cache=None  # opened on first use, only if we have a temp folder
+        self.temp_file_names=None # names of the files in the temp folder, loaded on first use
+        self.temp_file_writer=None # thread pool for saving temp files, started on first use
+        self.temp_file_lock=threading.Lock()  # newsletter fetch threads share the temp file names and writer
+        self.fetch_interrupted=threading.Event()  # tells the newsletter fetch threads to stop (e.g. on Ctrl-C); also cuts short their retry waits
+        self.thread_state=threading.local()  # per-thread HTTP session, see _get_session
+        self.rate_limiter=HostRateLimiter()  # paces our requests to each host, across all threads
+        self.retry_jitter=random.Random()    # own generator, so retry timing doesn't disturb the wildcard picks
+        self.wildcard_random=random.Random(random_seed)  # seeded (if requested) so a rerun on the same articles makes the same picks
+        self.render_epoch=None    # current time when we started generating the digest HTML, for article ages
 
     ''' Add one newsletter (from input CSV file OR reconstructed from articles CSV file) '''
     def _add_newsletter(self, newsletter_name, website_url, writer_name='', writer_handle='', category='', collections='', publisher_name=''):
@@ -161,13 +486,11 @@ class DigestGenerator:
         # or with the same writer name if it's an alias for multiple people who write in it.
         # If the same, don't duplicate it in our list. We'd just do extra work for nothing
         # and end up with duplicate articles in the digest.
-        duplicate=False
-        for newsletter in self.newsletters:
-            duplicate = newsletter_name==newsletter['name'] and writer_name==newsletter['writer_name']
-            if duplicate: break
-            # Also note the possibility that a newsletter could be in here twice: once
-            # with a name and once with blank (no matching). Going to ignore that for now.
-        if duplicate: 
+        # (This runs for every article row when reusing a CSV file, so check a set instead of scanning the list.)
+        # Also note the possibility that a newsletter could be in here twice: once
+        # with a name and once with blank (no matching). Going to ignore that for now.
+        newsletter_key = (newsletter_name, writer_name)
+        if newsletter_key in self.newsletter_keys: 
             #if self.verbose: print(f"  Skipping newsletter {newsletter_name} and writer '{writer_name}' (duplicate)")
             return None
 
@@ -184,6 +507,8 @@ class DigestGenerator:
             'article_count': 0,
         }                
         self.newsletters.append(newsletter)
+        self.newsletter_keys.add(newsletter_key)
+        self.newsletter_index = None
 
         #if self.verbose: print(f"  Added newsletter {newsletter} to list")
         return newsletter
@@ -240,19 +565,24 @@ class DigestGenerator:
         print(f"{GREEN_CHECKMARK_ICON}Loaded {len(self.newsletters)} newsletters from CSV")
         return True
 
-    def _api_call_retries(self, headers, url, max_retries=DEFAULT_RETRY_COUNT):
+    def _api_call_retries(self, headers, url, max_retries=DEFAULT_RETRY_COUNT, stream=False):
         ''' Retry API calls with increasing delays if we get 429 (or other) errors '''
 
         retry_count=0; delay=API_INITIAL_RETRY_DELAY
         while retry_count <= max_retries:  # Make sure we go through here once even if max_retries=0
+            if self.fetch_interrupted.is_set(): return None  # Ctrl-C; don't start another request
             response=None
             try:
-                response = requests.get(url, headers=headers, timeout=API_CALL_TIMEOUT) 
+                self.rate_limiter.wait(url)
+                response = self._get_session().get(url, headers=headers, timeout=API_CALL_TIMEOUT, stream=stream) 
 
-                if response.status_code == 200: 
+                # 304 Not Modified only comes back when we asked with the ETag of a cached copy
+                if response.status_code in (200, 304): 
                     #if self.verbose and retry_count>0: print(f"\nCall succeeded after {retry_count} retries.")
                     return response
-                # If we got a response other than 200, fall through to the error handling below
+                # If we got a response other than 200, fall through to the error handling below.
+                # Release its connection now (a streamed body isn't read otherwise); the status and headers stay available
+                response.close()
 
             except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError, requests.exceptions.RequestException) as e:
                 # If offline, calls seem to fail with 11001, getaddrinfo failed 
@@ -282,8 +612,13 @@ class DigestGenerator:
             retry_count += 1            
             if retry_count <= max_retries:
                 #if self.verbose: print(f"\nWaiting {delay} seconds before retry #{retry_count} ... ")
+                # If the server told us how long to back off, wait that long instead
+                if response is not None and response.status_code in (429, 503):
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit(): delay = float(retry_after)
                 print(STOPWATCH_ICON,end='', flush=True)                    
-                time.sleep(delay) 
+                # Wait, unless Ctrl-C stops the fetch in the meantime
+                if self.fetch_interrupted.wait(delay + self.retry_jitter.uniform(0, API_RETRY_JITTER)): return None
                 delay *= API_RETRY_RAMPUP  # double the delay for next time if this try fails
             else:
                 # not retrying or no more retries; show the error code
@@ -294,6 +629,61 @@ class DigestGenerator:
         print(f" {WARNING_TRIANGLE_ICON}Unable to complete API call to {url} after {retry_count} tries.")
         return None
         
+    def _get_session(self):
+        ''' HTTP session for the current thread, so repeated calls to the same Substack host reuse an open connection '''
+        # One per thread rather than one shared, since requests doesn't promise that a Session is thread-safe
+        session = getattr(self.thread_state, 'session', None)
+        if session is None:
+            session = self.thread_state.session = requests.Session()
+        return session
+
+    def _get_response_cache(self):
+        ''' Open the response cache in the temp folder, if we are saving temp files '''
+        if self.response_cache is None and len(self.temp_folder)>0:
+            if not os.path.isdir(self.temp_folder):
+                self.response_cache=False  # nowhere to keep it; don't check the folder again on every call
+                return None
+            try:
+                self.response_cache = ResponseCache(os.path.join(self.temp_folder, API_CACHE_FILENAME))
+            except sqlite3.Error as e:
+                print(f"{WARNING_TRIANGLE_ICON}Unable to open response cache in temp folder {self.temp_folder}: {e}")
+                self.response_cache=False  # don't keep trying
+        return self.response_cache or None
+
+    def _api_call_cached(self, headers, url, max_retries=DEFAULT_RETRY_COUNT, always_revalidate=False, as_bytes=False, max_bytes=0):
+        ''' Get the response text (or bytes) for a URL, reusing a recent copy from the response cache if we have one.
+        With always_revalidate, a cached copy is only reused after the server says it hasn't changed.
+        With max_bytes, only the start of a longer response is downloaded. '''
+        cache = self._get_response_cache()
+        cached = cache.get(url) if cache else None
+        if cached:
+            saved, etag, body, last_modified = cached
+            if not always_revalidate and cache.is_fresh(saved):
+                return body
+            # Ask the server to just tell us if it hasn't changed
+            if etag:
+                headers = dict(headers, **{'If-None-Match': etag})
+            if last_modified:
+                headers = dict(headers, **{'If-Modified-Since': last_modified})
+
+        response = self._api_call_retries(headers, url, max_retries=max_retries, stream=max_bytes>0)
+        if not response:
+            return None
+        # After Ctrl-C the cache has been (or is about to be) committed for the last time; leave it alone
+        if cache and self.fetch_interrupted.is_set():
+            cache = None
+        if response.status_code == 304 and cached:
+            if cache: cache.touch(url)
+            return cached[2]
+        if max_bytes>0:
+            content = read_response_start(response, max_bytes)
+            body = content if as_bytes else content.decode(response.encoding or 'utf-8', errors='replace')
+        else:
+            body = response.content if as_bytes else response.text
+        if cache:
+            cache.put(url, response.headers.get('ETag'), body, response.headers.get('Last-Modified'))
+        return body
+
     def _author_newsletter_count(self, newsletter_name, authors, articles):
         ''' see if we have hit our limit of articles per author-newsletter combo '''
         count=0
@@ -342,249 +732,328 @@ class DigestGenerator:
 
         print(f"   Date range: {cutoff_date.strftime('%Y-%m-%d')} to {today.strftime('%Y-%m-%d')}\n")
 
+        # Use these to speed up partial testing without having to manually subset the file
+        # Rows for the same newsletter are fetched in order on one thread, so the per-author limit sees them all
+        selected_rows = []
+        rows_by_newsletter = {}
+        row_limit_text = ''
+        for i, newsletter in enumerate(self.newsletters, 1):
+            if (max_rows>0) and (i-skip_rows > max_rows):
+                row_limit_text = f"  [{i}/{len(self.newsletters)}] Row limit {max_rows} reached after skipping {skip_rows} rows. Stopping newsletter processing."
+                break
+            if (skip_rows>0) and (i<=skip_rows):
+                if self.verbose: 
+                    print(f"  [{i}/{len(self.newsletters)}] {newsletter['name']}{self._newsletter_author_text(newsletter, match_authors)} - skipped")
+                continue
+            selected_rows.append((i, newsletter['name']))
+            rows_by_newsletter.setdefault(newsletter['name'], []).append((i, newsletter))
+
         articles = []
         success_count = 0
-        entry_count=0
-
-        for i, newsletter in enumerate(self.newsletters, 1):
-            try:
-                # Include author name if we are going to match on it
-                publisher_name=newsletter['publisher'] # KJS exact name of publisher, to use if no byline
-                writer_name=newsletter['writer_name']     # KJS partial or full name of writer to match on
-                writer_handle=newsletter['writer_handle'] # KJS 2025-11-17 writer handle in Substack
-                handle_text = f" @{writer_handle}" if len(writer_handle)>0 else ""
-                author_text = f" ({writer_name}{handle_text})" if match_authors and len(writer_name)>0 else ''
-
-                # Use these to speed up partial testing without having to manually subset the file
-                if (max_rows>0) and (i-skip_rows > max_rows):
-                    if self.verbose: print(f"  [{i}/{len(self.newsletters)}] Row limit {max_rows} reached after skipping {skip_rows} rows. Stopping newsletter processing.")
-                    break
-                if (skip_rows>0) and (i<=skip_rows):
-                    if self.verbose: 
-                        print(f"  [{i}/{len(self.newsletters)}] {newsletter['name']}{author_text} - skipped")
-                    continue
+        fetch_args = dict(cutoff_date=cutoff_date, use_Substack_API=use_Substack_API, max_retries=max_retries, match_authors=match_authors, max_per_author=max_per_author)
+
+        # Fetch several newsletters at once (the time goes to waiting on Substack, not to our processing).
+        # Workers collect their progress output, and we print it here in the original newsletter order.
+        self._get_response_cache()  # open it now, before the threads share it
+        self.fetch_interrupted.clear()
+        output = ThreadOutputCollector(sys.stdout)
+        pool = ThreadPoolExecutor(max_workers=NEWSLETTER_FETCH_THREADS)
+        sys.stdout = output
+        try:
+            futures = {name: pool.submit(self._fetch_newsletter_group, rows, output, **fetch_args) for name, rows in rows_by_newsletter.items()}
+            for i, name in selected_rows:
+                row_results = futures[name].result()
+                if i not in row_results: break  # stopped early
+                row_articles, row_output, article_count = row_results[i]
+                output.stream.write(row_output)
+                output.stream.flush()
+                articles.extend(row_articles)
+                if article_count: success_count += 1
+
+        except KeyboardInterrupt:
+            # Threads stop at their next article (or retry wait); the rest don't start
+            self.fetch_interrupted.set()
+            print("\n\n👋 Digest generator interrupted by user - will save data already collected")
+
+        finally:
+            # After Ctrl-C, leave the collector in place: threads still finishing a newsletter
+            # keep their output to themselves instead of printing it into the rest of the run
+            if not self.fetch_interrupted.is_set(): sys.stdout = output.stream
+            pool.shutdown(wait=not self.fetch_interrupted.is_set(), cancel_futures=True)
+
+        if len(row_limit_text)>0 and self.verbose and not self.fetch_interrupted.is_set(): print(row_limit_text)
+
+        # Make sure all of the temp files, and the responses we cached, are on disk before we go on
+        self._finish_temp_file_writes()
+        if self.response_cache: self.response_cache.commit()
 
-                print(f"  [{i}/{len(self.newsletters)}] {newsletter['name']}{author_text} ...", end='', flush=True)
+        print(f"\n{GREEN_CHECKMARK_ICON}Fetched {len(articles)} total articles from {success_count} newsletters")
+        self.articles = articles
+        return articles
 
-                # Fetch RSS feed; retry if it times out or is overloaded
-                headers = {'User-Agent': 'Mozilla/5.0 (compatible; DigestBot/1.0)'}
-                response = self._api_call_retries(headers, newsletter['rss_url'], max_retries=max_retries)
-                if not response:
-                    print(f"\n{RED_X_FAILURE_ICON}ERROR: RSS API call failed with {max_retries} retries; skipping this newsletter")
-                    continue
+    def _newsletter_author_text(self, newsletter, match_authors):
+        ''' Writer name and handle to show with the newsletter name, if we are going to match on them '''
+        writer_name=newsletter['writer_name']
+        handle_text = f" @{newsletter['writer_handle']}" if len(newsletter['writer_handle'])>0 else ""
+        return f" ({writer_name}{handle_text})" if match_authors and len(writer_name)>0 else ''
+
+    def _fetch_newsletter_group(self, rows, output, **fetch_args):
+        ''' Fetch the rows for one newsletter, in order, on a fetch thread. Returns a dict of
+        (articles, progress output, article count) for each row number. '''
+        articles = []  # for all of these rows, so the per-author limit counts articles from each row
+        feeds = {}     # parsed RSS feed by URL, so rows for other writers in the same newsletter don't fetch and parse it again
+        results = {}
+        for i, newsletter in rows:
+            if self.fetch_interrupted.is_set(): break
+            start = len(articles)
+            output.start()
+            try:
+                article_count = self._fetch_newsletter_articles(i, newsletter, articles, feeds=feeds, **fetch_args)
 
-                feed = feedparser.parse(response.content)
+            except Exception as e:
+                print(f"\n{RED_X_FAILURE_ICON}EXCEPTION on retrieving newsletter articles for {newsletter}:\n{e}")
+                if self.verbose: traceback.print_exc()
+                newsletter['article_count']=-1
+                article_count = None
+
+            results[i] = (articles[start:], output.finish(), article_count)
+        return results
+
+    def _fetch_newsletter_articles(self, i, newsletter, articles, cutoff_date, use_Substack_API=SUBSTACK_API_DEFAULT, max_retries=MAX_RETRY_COUNT, match_authors=MATCH_AUTHORS_DEFAULT, max_per_author=DEFAULT_PER_AUTHOR, feeds=None):
+        ''' Fetch the recent articles from one newsletter's RSS feed and add them to articles. Returns the article count, or None if the feed could not be read.
+        feeds: parsed feeds by RSS URL from earlier rows of the same newsletter, reused instead of fetching again (and updated) '''
+        # Include author name if we are going to match on it
+        publisher_name=newsletter['publisher'] # KJS exact name of publisher, to use if no byline
+        writer_name=newsletter['writer_name']     # KJS partial or full name of writer to match on
+        writer_handle=newsletter['writer_handle'] # KJS 2025-11-17 writer handle in Substack
+        author_text = self._newsletter_author_text(newsletter, match_authors)
+
+        print(f"  [{i}/{len(self.newsletters)}] {newsletter['name']}{author_text} ...", end='', flush=True)
+
+        # Another row of this newsletter (a different writer) may have fetched the feed already during this run
+        feed = feeds.get(newsletter['rss_url']) if feeds is not None else None
+        if feed is None:
+            # Fetch RSS feed; retry if it times out or is overloaded.
+            # New articles can show up at any time, so always check with the server before reusing a cached feed;
+            # if it hasn't changed (HTTP 304), we don't download it again. Raw bytes, so feedparser can detect the encoding.
+            headers = {'User-Agent': 'Mozilla/5.0 (compatible; DigestBot/1.0)'}
+            feed_content = self._api_call_cached(headers, newsletter['rss_url'], max_retries=max_retries, always_revalidate=True, as_bytes=True)
+            if feed_content is None:
+                print(f"\n{RED_X_FAILURE_ICON}ERROR: RSS API call failed with {max_retries} retries; skipping this newsletter")
+                return None
+
+            # We only read titles, links, dates, authors and text from the entries (summaries and content get their
+            # tags stripped below), so skip feedparser's HTML sanitizing and link resolving; they are most of its parse time
+            import feedparser
+            feed = feedparser.parse(feed_content, resolve_relative_uris=False, sanitize_html=False)
+            if feeds is not None: feeds[newsletter['rss_url']] = feed
                 
-                # KJS 2025-11-24 TO DO: Save RSS feed file to temp_folder, if saving is enabled?
+        # KJS 2025-11-24 TO DO: Save RSS feed file to temp_folder, if saving is enabled?
                 
-                article_count = 0
-
-                for entry in feed.entries:
-
-                    # Parse publication date
-                    pub_date = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        pub_date = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        pub_date = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
-
-                    # Can't do much without a date
-                    if not pub_date:
-                        if self.verbose: 
-                            print(f"{WARNING_TRIANGLE_ICON}Warning: Unable to find publication date for RSS entry:\n{entry}")
-                        continue
-
-                    # Skip old articles (could break out of RSS reading to speed things up?)
-                    if pub_date < cutoff_date:
-                        continue
-
-                    # Extract author(s) from RSS feed
-                    authors = []
-                    #creator = self._extract_dc_creator_from_entry(entry)
-                    if hasattr(feed, 'dc_creator') and feed.dc_creator:
-                        creator = feed.dc_creator
-                        if self.verbose: 
-                            print(f"️Found creator name {creator} in RSS feed (not in entry)")
-                    else:
-                        creator=''
+        article_count = 0
+
+        # feedparser has already parsed each date string (RFC 822 or ISO 8601) and converted it to UTC,
+        # whatever time zone the feed used. RSS feeds normally list the newest entries first; check that this
+        # one does (rather than assume it) so we can stop at the first entry older than the cutoff date.
+        entry_dates = [entry.get('published_parsed') or entry.get('updated_parsed') for entry in feed.entries]
+        newest_first = all(entry_dates) and all(newer >= older for newer, older in zip(entry_dates, entry_dates[1:]))
+
+        for entry, parsed_date in zip(feed.entries, entry_dates):
+            if self.fetch_interrupted.is_set(): break  # Ctrl-C; the articles so far are dropped with the rest of this newsletter
+
+            # Parse publication date
+            pub_date = datetime(*parsed_date[:6], tzinfo=timezone.utc) if parsed_date else None
+
+            # Can't do much without a date
+            if not pub_date:
+                if self.verbose: 
+                    print(f"{WARNING_TRIANGLE_ICON}Warning: Unable to find publication date for RSS entry:\n{entry}")
+                continue
+
+            # Skip old articles. If the feed is newest first, the rest are older still.
+            if pub_date < cutoff_date:
+                if newest_first: break
+                continue
+
+            # Extract author(s) from RSS feed
+            authors = []
+            #creator = self._extract_dc_creator_from_entry(entry)
+            if hasattr(feed, 'dc_creator') and feed.dc_creator:
+                creator = feed.dc_creator
+                if self.verbose: 
+                    print(f"️Found creator name {creator} in RSS feed (not in entry)")
+            else:
+                creator=''
                         
-                    # KJS 2025-11-24 Try 'authors' first, then fall back to 'author' if not found
-                    # At this point in time, even the Substack 'authors' tag has only one name in it :(
-                    if hasattr(entry, 'authors') and entry.authors:
-                        authors.extend([a.get('name', a) if isinstance(a, dict) else a for a in entry.authors])
-                        #if self.verbose: 
-                        #    print(f"️Found author names {authors}")
-
-                    elif hasattr(entry, 'author') and entry.author:
-                        authors.append(entry.author)
-                        #if self.verbose: 
-                        #    print(f"️Found author name {entry.author}")
-
-                    # KJS 2025-11-24 look for creator if no author byline
-                    elif creator and len(creator)>0:
-                       authors.append(creator)
-                       #if self.verbose: 
-                       #    print(f"️\n{WARNING_TRIANGLE_ICON}No author name found; defaulting to creator name '{creator}'")
+            # KJS 2025-11-24 Try 'authors' first, then fall back to 'author' if not found
+            # At this point in time, even the Substack 'authors' tag has only one name in it :(
+            if hasattr(entry, 'authors') and entry.authors:
+                authors.extend([a.get('name', a) if isinstance(a, dict) else a for a in entry.authors])
+                #if self.verbose: 
+                #    print(f"️Found author names {authors}")
+
+            elif hasattr(entry, 'author') and entry.author:
+                authors.append(entry.author)
+                #if self.verbose: 
+                #    print(f"️Found author name {entry.author}")
+
+            # KJS 2025-11-24 look for creator if no author byline
+            elif creator and len(creator)>0:
+               authors.append(creator)
+               #if self.verbose: 
+               #    print(f"️\n{WARNING_TRIANGLE_ICON}No author name found; defaulting to creator name '{creator}'")
                         
-                    elif len(publisher_name)>0: 
-                        # KJS 2025-11-17 If no byline or creator in item, try using the name of the Newsletter Publisher if known
-                        authors.append(publisher_name)
-                        #if self.verbose: 
-                        #    print(f"️\n{WARNING_TRIANGLE_ICON}No author name found; defaulting to publisher name '{publisher_name}'")
-                    else:
-                        # Some articles don't have bylines or a single known publisher.
-                        # Make the unknown author name unique to newsletter so that we don't inadvertently
-                        # match or exclude other unknown authors
-                        unknown_author="("+UNKNOWN_AUTHOR_DEFAULT+" at "+newsletter['name']+")"
-                        authors.append(unknown_author) # ensure authors[0] references will always work
-                        #if self.verbose: 
-                        #    print(f"️\n{WARNING_TRIANGLE_ICON}No author name found; defaulting to {unknown_author}")
-
-                    # KJS 2025-11-24 Get engagement metrics AND, potentially, a more complete author list
-                    # BEFORE we check for matching
+            elif len(publisher_name)>0: 
+                # KJS 2025-11-17 If no byline or creator in item, try using the name of the Newsletter Publisher if known
+                authors.append(publisher_name)
+                #if self.verbose: 
+                #    print(f"️\n{WARNING_TRIANGLE_ICON}No author name found; defaulting to publisher name '{publisher_name}'")
+            else:
+                # Some articles don't have bylines or a single known publisher.
+                # Make the unknown author name unique to newsletter so that we don't inadvertently
+                # match or exclude other unknown authors
+                unknown_author="("+UNKNOWN_AUTHOR_DEFAULT+" at "+newsletter['name']+")"
+                authors.append(unknown_author) # ensure authors[0] references will always work
+                #if self.verbose: 
+                #    print(f"️\n{WARNING_TRIANGLE_ICON}No author name found; defaulting to {unknown_author}")
+
+            # KJS 2025-11-24 Get engagement metrics AND, potentially, a more complete author list
+            # BEFORE we check for matching
                     
-                    # Extract article data (build this structure now so the engagement metrics methods can use it
-                    # and update it as needed)
-                    title = entry.get('title', '')
-                    article = {
-                        'title': title,
-                        'link': entry.get('link', ''),
-                        'summary': self._clean_summary(entry.get('summary', '')),
-                        'published': pub_date,
-                        'authors': authors,  # List of article author names; may change below 
-                        'publisher_name': publisher_name, 
-                        'newsletter_name': newsletter['name'], 
-                        'newsletter_link': newsletter['url'], 
-                        'newsletter_category': newsletter['category'],
-                        'writer_name': writer_name, # KJS 2025-11-24 writer name (the one we were looking for, if matching; if not, then it will be updated to the final authors[0] name)
-                        'writer_handle': writer_handle, # KJS 2025-11-17 newsletter author handle, if in newsletters file; not currently used
-                        'word_count': 0, # will be updated below
-                        'comment_count': 0,
-                        'reaction_count': 0,
-                        'restack_count': 0,
-                        'filename': '' if len(self.temp_folder)==0 else self._make_unique_temp_filename (title, writer_name, authors), # will update below if writer_name or authors[] changes
-                        'raw_score': 0.0,
-                        'score': 0.0,
-                    }
-
-                    # Added 2025-11-13 KJS - before we make API calls, give Substack an extra breather 
-                    # to try to minimize 429 errors when processing large lists of newsletters 
-                    # 2025-11-18: or using long lookback periods
-                    entry_count += 1
-                    if ((i+entry_count) % 20 == 0): 
-                        print(".",end='', flush=True) # reserve the stopwatch icon for retries
-                        time.sleep(API_PERIODIC_DELAY) # 5.0
-
-                    # If we are using the Substack API, call it now so we can get the full author list and fill
-                    # in writer_names if more than one (primary name to be used in the temp_folder filenames).
-                    # This will also give us data for restacks, and we can optionally save the JSON too.
-                    if use_Substack_API:
-                        self._fetch_engagement_metrics_substack_api(article, max_retries)
-                        authors = article['authors']
-
-                    # 2025-11-21 Always fetch, and optionally save, the HTML.
-                    # Only get engagement metrics from HTML if not available from Substack API.
-                    # This method doesn't currently update author list, so no change to filename.
-                    self._fetch_engagement_from_html(article, max_retries)
-
-                    # KJS 2025-11-15 If the input CSV has an Author column, match on it (allow partial matches)
-                    # Note: Once we have multiple author names working, we won't need partial matching any more.
-                    # We can just see if our author name exactly matches any of the names in the list.
-                    if match_authors and len(writer_name)>0:
-                        if not self._compare_author_name(authors, writer_name):
-                            # The writer we want is not in this list of authors; skip it
-                            #if self.verbose: print(f" {WARNING_TRIANGLE_ICON}Looking in {newsletter['name']} for {writer_name}, found {authors}; skipping article")
-                            continue
-                        # It matched. Writer_name is THE author for this newsletter for our purposes.
-                        # (But what if two people in our directory write an article together in the same
-                        # newsletter? We'll end up putting the same article in the articles list, once with
-                        # each name (each row of the newsletters.csv file). 
-                        # But we only want the article to appear once in the digest, showing both names. 
-                        # Need to handle this when we are choosing what to show on the digest page. TO DO.
-
-                    # KJS 2025-11-18 If we have a limit per newsletter/author, enforce it here. RSS file is always
-                    # in descending order by date, so that means we automatically keep the most recent article(s).
-                    # Note: If we had multiple authors, this would currently limit to N per author combo
-                    if max_per_author and self._author_newsletter_count(newsletter['name'], authors, articles)>=max_per_author:
-                        #if self.verbose: print(f" {WARNING_TRIANGLE_ICON}Limit of {max_per_author} articles exceeded for {authors} in {newsletter['name']}; skipping article")
-                        # Keep looking in this newsletter if it's possible that we have multiple authors
-                        if match_authors: break;
-                        # We're not matching on author name. Go on to the next entry in the RSS file.
-                        # There might be articles by other authors we want.
-                        continue
-
-                    # Get content for word count (try content first, fallback to summary)
-                    content_html = ''
-                    if hasattr(entry, 'content') and entry.content:
-                        # RSS content is usually a list of dicts with 'value' key
-                        if isinstance(entry.content, list) and len(entry.content) > 0:
-                            content_html = entry.content[0].get('value', '')
-                        else:
-                            content_html = str(entry.content)
-                    elif hasattr(entry, 'summary') and entry.summary:
-                        content_html = entry.summary
-
-                    # Calculate word count from content
-                    word_count = 0
-                    if content_html:
-                        text = BeautifulSoup(content_html, 'html.parser').get_text().strip()
-                        word_count = len(text.split())
-
-                    # Update article data (but only if valid and _fetch_engagement_from_html failed)
-                    # Hopefully they match??
-                    if word_count > 0: 
-                        if article['word_count']>0 and article['word_count']!=word_count:
-                            # so far, in testing, they rarely differ and when they do, RSS = HTML + 2. ?
-                            # Only print a warning if the difference exceeds that.
-                            diff = abs(article['word_count']-word_count)
-                            if diff>2 and self.verbose:
-                                print(f"\n{WARNING_TRIANGLE_ICON}Warning: HTML word count {article['word_count']} and RSS word count {word_count} differ by {diff}")
-                        article['word_count']=word_count
-
-                    articles.append(article)
-                    article_count += 1
-                    print(GREEN_CHECKMARK_ICON, end='', flush=True) # Print a checkmark for each article
-
-                # Done with all entries in RSS file for this newsletter
-                newsletter['article_count']=article_count
-                if article_count > 0:
-                    explanation=' (multiple co-authors)' if max_per_author>0 and article_count>max_per_author else ''
-                    print(f" - {article_count} article{'s' if article_count>1 else ''}{explanation}")
-                    success_count += 1
-                else:
-                    print(f" - (no recent articles)")
-
-            except KeyboardInterrupt:
-                print("\n\n👋 Digest generator interrupted by user - will save data already collected")
-                break
+            # Extract article data (build this structure now so the engagement metrics methods can use it
+            # and update it as needed)
+            title = entry.get('title', '')
+            article = {
+                'title': title,
+                'link': entry.get('link', ''),
+                'summary': self._clean_summary(entry.get('summary', '')),
+                'published': pub_date,
+                'published_epoch': pub_date.timestamp(), # seconds, for fast age calculations
+                'published_utc_text': pub_date.strftime(PUBLISHED_UTC_FORMAT), # formatted once for the HTML and the CSV
+                'authors': authors,  # List of article author names; may change below 
+                'publisher_name': publisher_name, 
+                'newsletter_name': newsletter['name'], 
+                'newsletter_link': newsletter['url'], 
+                'newsletter_category': newsletter['category'],
+                'writer_name': writer_name, # KJS 2025-11-24 writer name (the one we were looking for, if matching; if not, then it will be updated to the final authors[0] name)
+                'writer_handle': writer_handle, # KJS 2025-11-17 newsletter author handle, if in newsletters file; not currently used
+                'word_count': 0, # will be updated below
+                'comment_count': 0,
+                'reaction_count': 0,
+                'restack_count': 0,
+                'filename': '', # temp file name (no extension), picked when we first save a temp file for this article (see _save_temp_file)
+                'raw_score': 0.0,
+                'score': 0.0,
+            }
 
-            except Exception as e:
-                print(f"\n{RED_X_FAILURE_ICON}EXCEPTION on retrieving newsletter articles for {newsletter}:\n{e}")
-                if self.verbose: traceback.print_exc()
-                newsletter['article_count']=-1
+            # _api_call_retries paces our calls to Substack (see HostRateLimiter) to minimize 429 errors
+            # when processing large lists of newsletters or using long lookback periods
+
+            # If we are using the Substack API, call it now so we can get the full author list and fill
+            # in writer_names if more than one (primary name to be used in the temp_folder filenames).
+            # This will also give us data for restacks, and we can optionally save the JSON too.
+            api_body_html = ''
+            if use_Substack_API:
+                api_body_html = self._fetch_engagement_metrics_substack_api(article, max_retries)
+                authors = article['authors']
+
+            # KJS 2025-11-15 If the input CSV has an Author column, match on it (allow partial matches)
+            # Note: Once we have multiple author names working, we won't need partial matching any more.
+            # We can just see if our author name exactly matches any of the names in the list.
+            if match_authors and len(writer_name)>0:
+                if not self._compare_author_name(authors, writer_name):
+                    # The writer we want is not in this list of authors; skip it
+                    #if self.verbose: print(f" {WARNING_TRIANGLE_ICON}Looking in {newsletter['name']} for {writer_name}, found {authors}; skipping article")
+                    continue
+                # It matched. Writer_name is THE author for this newsletter for our purposes.
+                # (But what if two people in our directory write an article together in the same
+                # newsletter? We'll end up putting the same article in the articles list, once with
+                # each name (each row of the newsletters.csv file). 
+                # But we only want the article to appear once in the digest, showing both names. 
+                # Need to handle this when we are choosing what to show on the digest page. TO DO.
+
+            # KJS 2025-11-18 If we have a limit per newsletter/author, enforce it here. RSS file is always
+            # in descending order by date, so that means we automatically keep the most recent article(s).
+            # Note: If we had multiple authors, this would currently limit to N per author combo
+            if max_per_author and self._author_newsletter_count(newsletter['name'], authors, articles)>=max_per_author:
+                #if self.verbose: print(f" {WARNING_TRIANGLE_ICON}Limit of {max_per_author} articles exceeded for {authors} in {newsletter['name']}; skipping article")
+                # Keep looking in this newsletter if it's possible that we have multiple authors
+                if match_authors: break;
+                # We're not matching on author name. Go on to the next entry in the RSS file.
+                # There might be articles by other authors we want.
                 continue
 
-        print(f"\n{GREEN_CHECKMARK_ICON}Fetched {len(articles)} total articles from {success_count} newsletters")
-        self.articles = articles
-        return articles
+            # 2025-11-21 Always fetch, and optionally save, the HTML.
+            # Only get engagement metrics from HTML if not available from Substack API.
+            # This method doesn't currently update author list, so it can wait until the article has
+            # passed the author and per-author limit checks; pages for skipped articles aren't fetched.
+            self._fetch_engagement_from_html(article, max_retries)
+
+            # Get content for word count (try content first, fallback to summary)
+            content_html = ''
+            if hasattr(entry, 'content') and entry.content:
+                # RSS content is usually a list of dicts with 'value' key
+                if isinstance(entry.content, list) and len(entry.content) > 0:
+                    content_html = entry.content[0].get('value', '')
+                else:
+                    content_html = str(entry.content)
+            elif hasattr(entry, 'summary') and entry.summary:
+                content_html = entry.summary
+
+            # Calculate word count from content
+            word_count = 0
+            if content_html:
+                word_count = self._count_words(content_html)
+
+            # The RSS word count wins when we have one, so only count the Substack API body
+            # if we need it as a fallback or for the verbose comparison below
+            if api_body_html and (word_count <= 0 or self.verbose):
+                article['word_count'] = self._count_words(api_body_html)
+
+            # Update article data (but only if valid and _fetch_engagement_from_html failed)
+            # Hopefully they match??
+            if word_count > 0: 
+                if article['word_count']>0 and article['word_count']!=word_count:
+                    # so far, in testing, they rarely differ and when they do, RSS = HTML + 2. ?
+                    # Only print a warning if the difference exceeds that.
+                    diff = abs(article['word_count']-word_count)
+                    if diff>2 and self.verbose:
+                        print(f"\n{WARNING_TRIANGLE_ICON}Warning: HTML word count {article['word_count']} and RSS word count {word_count} differ by {diff}")
+                article['word_count']=word_count
+
+            articles.append(article)
+            article_count += 1
+            print(GREEN_CHECKMARK_ICON, end='', flush=True) # Print a checkmark for each article
+
+        # Done with all entries in RSS file for this newsletter
+        newsletter['article_count']=article_count
+        if article_count > 0:
+            explanation=' (multiple co-authors)' if max_per_author>0 and article_count>max_per_author else ''
+            print(f" - {article_count} article{'s' if article_count>1 else ''}{explanation}")
+        else:
+            print(f" - (no recent articles)")
+        return article_count
+
 
     def _fetch_engagement_metrics_substack_api(self, article, max_retries=MAX_RETRY_COUNT):
         ''' Fetch engagement metrics -- and maybe, author list -- from Substack's public API '''
         ''' Save the JSON data to temp file if enabled - even though we have not yet checked for writer_name matching, so this might not be an article that we end up including '''
+        ''' Returns the article body HTML (or '') so the caller can count its words only if the RSS content doesn't give a count '''
+        body_html = ''
         try:
             # Extract slug from URL
             # Format: https://newsletter.substack.com/p/slug-here
-            match = re.search(r'/p/([^/?\#]+)', article['link'])
+            match = SLUG_RE.search(article['link'])
             if not match:
-                return
+                return body_html
 
             slug = match.group(1)
 
             # Extract base URL
-            base_url_match = re.match(r'(https?://[^/]+)', article['link'])
+            base_url_match = BASE_URL_RE.match(article['link'])
             if not base_url_match:
                 # warning needed??
-                return
+                return body_html
 
             base_url = base_url_match.group(1)
 
@@ -596,27 +1065,25 @@ class DigestGenerator:
             }
 
             # KJS added retries on Substack API for engagement metrics
-            response = self._api_call_retries(headers, api_url, max_retries=max_retries)
-            if response:
-                post_data = response.json()
+            # Take the raw bytes: orjson (and json) parse UTF-8 bytes directly, so there's no need to decode to text first
+            response_text = self._api_call_cached(headers, api_url, max_retries=max_retries, as_bytes=True)
+            if response_text is not None:
+                post_data = json_loads(response_text)
 
-                # Extract engagement metrics
-                article['comment_count'] = post_data.get('comment_count', 0)
+                # Extract engagement metrics (stored as ints, so the formatting code can trust the type)
+                article['comment_count'] = int(post_data.get('comment_count') or 0)
 
                 # Sum up reactions
                 reactions = post_data.get('reactions', {})
                 if isinstance(reactions, dict):
-                    article['reaction_count'] = sum(reactions.values())
+                    article['reaction_count'] = int(sum(reactions.values()))
 
                 # Restacks are not available at present in the HTML post data
                 # We can only get them here in the Substack API call.
-                article['restack_count'] = post_data.get('restacks', 0)
+                article['restack_count'] = int(post_data.get('restacks') or 0)
 
-                # Get word count from body
-                body_html = post_data.get('body_html', '')
-                if body_html:
-                    text = BeautifulSoup(body_html, 'html.parser').get_text()
-                    article['word_count'] = len(text.split())
+                # Keep the body for the word count; the caller decides whether it needs it
+                body_html = post_data.get('body_html') or ''
 
                 # The RSS feed typically gives us just one name. We want to look for
                 # multiple authors here. Let's use the JSON to augment the author list,
@@ -661,16 +1128,12 @@ class DigestGenerator:
                 #        },
 
                 # KJS 2025-11-21 Save API call response as JSON file, if enabled
-                # Now that we know the real author name (writer_name), set the filename
+                # Now that we know the real author name (writer_name), the filename is based on it
                 # If there is no writer_name, use the first name in the author list
                 # 2025-12-11: To avoid problems with long digest periods and authors who reuse 
                 # the same title week after week, add the article datetime to the temp file name.
-                article_filename = ''
-                if len(self.temp_folder)>0:
-                    article_stub = f"{article['title']}_{article['published'].isoformat()}"
-                    article_filename = self._make_unique_temp_filename (article_stub, article['writer_name'], article['authors'])
-                self._save_article_json(post_data, article_filename)
-                article['filename'] = article_filename
+                article_stub = f"{article['title']}_{article['published'].isoformat()}"
+                self._save_temp_file(self._save_article_json, post_data, article, article_stub)
                 
             else:
                 if self.verbose: 
@@ -682,6 +1145,8 @@ class DigestGenerator:
                 print(f" {WARNING_TRIANGLE_ICON}Warning: exception on engagement metrics API call to Substack for {api_url}:\n{e}")
                 traceback.print_exc()
             pass
+
+        return body_html
             
     def _make_unique_temp_filename (self, title, writer, authors):
         ''' Do NOT overwrite an existing file. We could have two articles with the same title
@@ -689,6 +1154,7 @@ class DigestGenerator:
         If that fails, add an incrementing number to the file until we get to a unique name.
         Problem: How to keep the JSON and HTML file numbering in sync?
         Solution: Check for existence under both extensions, once, before creating either one.
+        Call with temp_file_lock held; the name is claimed under both extensions before we return it.
         '''
 
         if len(self.temp_folder)==0: return ''  # not saving temp files
@@ -703,15 +1169,17 @@ class DigestGenerator:
         sanitized_title=make_valid_filename (title) 
         sanitized_filename=sanitized_author+"_"+sanitized_title
         
+        # Check names against our list of what's in the temp folder, instead of asking the filesystem each time
         number_text=''; number=0
         MAXTRIES=10
+        temp_file_names=self._get_temp_file_names()
         while number < MAXTRIES:
-            json_output_path = os.path.join(self.temp_folder,number_text+sanitized_filename+".json")        
-            html_output_path = os.path.join(self.temp_folder,number_text+sanitized_filename+".html")        
-            full_json_path = Path(json_output_path)
-            full_html_path = Path(html_output_path)
+            json_name = os.path.normcase(number_text+sanitized_filename+".json")
+            html_name = os.path.normcase(number_text+sanitized_filename+".html")
 
-            if not full_json_path.exists() and not full_html_path.exists():
+            if json_name not in temp_file_names and html_name not in temp_file_names:
+                # Claim both names now, so they aren't handed out again (e.g. to another fetch thread) before the write finishes
+                temp_file_names.update((json_name, html_name))
                 return os.path.join(self.temp_folder,number_text+sanitized_filename) # exclude extension
 
             # Start adding numbers to the filename.
@@ -724,15 +1192,60 @@ class DigestGenerator:
             print(f"{WARNING_TRIANGLE_ICON}Warning: Unable to create unique temp file name for {authors} {title} after {MAXTRIES} tries")
         return ''
 
-    def _save_article_json(self, data, filename, indent=4):
+    def _get_temp_file_names(self):
+        ''' List the temp folder once; _make_unique_temp_filename adds each name it hands out '''
+        if self.temp_file_names is None:
+            try:
+                # normcase so that names compare the way the filesystem does (e.g. not case-sensitive on Windows)
+                self.temp_file_names = {os.path.normcase(name) for name in os.listdir(self.temp_folder)}
+            except OSError:
+                self.temp_file_names = set()
+        return self.temp_file_names
+
+    def _save_temp_file(self, save_method, content, article, title=''):
+        ''' Save a temp file for an article on a background thread, so the disk write overlaps with our next network call.
+        title: basis for the file name (default: the article title), if this is the article's first temp file '''
+        if len(self.temp_folder)==0: return
+
+        with self.temp_file_lock:
+            # After Ctrl-C, the writes still in progress have been (or are being) finished for the last time
+            if self.fetch_interrupted.is_set(): return
+            # Name the files when we first write one for this article, so articles that were skipped before
+            # then don't use up a number; the JSON and HTML files for an article share the name
+            if len(article['filename'])==0:
+                article['filename'] = self._make_unique_temp_filename(title or article['title'], article['writer_name'], article['authors'])
+                if len(article['filename'])==0: return
+            if self.temp_file_writer is None:
+                self.temp_file_writer = ThreadPoolExecutor(max_workers=TEMP_FILE_WRITER_THREADS)
+            self.temp_file_writer.submit(save_method, content, article['filename'])
+
+    def _finish_temp_file_writes(self):
+        ''' Wait for any temp file writes still in progress '''
+        with self.temp_file_lock:
+            temp_file_writer, self.temp_file_writer = self.temp_file_writer, None
+        if temp_file_writer is not None:
+            temp_file_writer.shutdown(wait=True)
+
+    def _save_article_json(self, data, filename, indent=2):
         '''Save individual article engagement data from Substack API to JSON file. Assume filename includes folder path. '''
         if len(filename)==0: return False
 
         # Assume we have pre-checked for safe overwrite outside of this.
         output_path = filename+".json"
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
+            json_bytes = None
+            if orjson:
+                try:
+                    # orjson only indents by 2, which is plenty for these files
+                    json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+                except TypeError:
+                    pass  # something orjson can't serialize (e.g. a huge int); let the json module handle it
+            if json_bytes is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(json_bytes)
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=indent, ensure_ascii=False)
             return True
                         
         except (FileNotFoundError, IOError, OSError, PermissionError) as e:        
@@ -761,28 +1274,31 @@ class DigestGenerator:
             headers = {'User-Agent': 'Mozilla/5.0 (compatible; DigestBot/1.0)'}
             # KJS 2025-11-17 Add retry handling here too. Engagement metrics are sort of optional, 
             # but the consequences could be misrepresenting an author's article as having no engagement.
-            response = self._api_call_retries(headers, article['link'], max_retries=max_retries)
-            if not response:
+            # The metrics are in the page head and the buttons near the top, so we don't need all of a huge page,
+            # unless we are saving copies of the pages in the temp folder
+            max_bytes = 0 if len(self.temp_folder)>0 else ARTICLE_PAGE_MAX_BYTES
+            response_text = self._api_call_cached(headers, article['link'], max_retries=max_retries, max_bytes=max_bytes)
+            if response_text is None:
                 if self.verbose: 
                     print(f" {WARNING_TRIANGLE_ICON}Warning: HTML page request for {article['link']} failed after {max_retries} retries. No engagement metrics available.")
                 return
 
             # To better support development, provide an option to save a copy of the HTML files we fetch
-            self._save_article_html(response.text, article['filename'])
+            self._save_temp_file(self._save_article_html, response_text, article)
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response_text, HTML_PARSER, parse_only=ENGAGEMENT_STRAINER)
 
             # Don't overwrite metrics we may have already gotten from the Substack API
             # Method 1: Parse interactionStatistic meta tag (structured data)
             meta_tag = soup.find('meta', {'property': 'interactionStatistic'})
             if meta_tag and meta_tag.get('content'):
                 try:
-                    stats = json.loads(meta_tag['content'])
+                    stats = json_loads(meta_tag['content'])
                     for stat in stats:
                         if stat.get('interactionType') == 'https://schema.org/LikeAction' and article['reaction_count']== 0:
-                            article['reaction_count'] = stat.get('userInteractionCount', 0)
+                            article['reaction_count'] = int(stat.get('userInteractionCount', 0))
                         elif stat.get('interactionType') == 'https://schema.org/CommentAction'and article['comment_count'] == 0:
-                            article['comment_count'] = stat.get('userInteractionCount', 0)
+                            article['comment_count'] = int(stat.get('userInteractionCount', 0))
                         # restack_count is not available (ShareAction doesn't work).
                 except json.JSONDecodeError:
                     if self.verbose:
@@ -790,27 +1306,17 @@ class DigestGenerator:
                     pass
 
             # Method 2: Parse aria-labels from buttons (backup method)
-            if article['reaction_count'] == 0:
-                like_button = soup.find('button', {'aria-label': re.compile(r'Like \((\d+)\)')})
-                if like_button:
-                    match = re.search(r'Like \((\d+)\)', like_button.get('aria-label', ''))
-                    if match:
-                        article['reaction_count'] = int(match.group(1))
-
-            if article['comment_count'] == 0:
-                comment_button = soup.find('button', {'aria-label': re.compile(r'View comments \((\d+)\)')})
-                if comment_button:
-                    match = re.search(r'View comments \((\d+)\)', comment_button.get('aria-label', ''))
-                    if match:
-                        article['comment_count'] = int(match.group(1))
-
             # KJS 2025-11-13 Try to count restacks this way too (doesn't seem to be available)
-            if article['restack_count'] == 0: 
-                comment_button = soup.find('button', {'aria-label': re.compile(r'Restack \((\d+)\)')})
-                if comment_button:
-                    match = re.search(r'Restack \((\d+)\)', comment_button.get('aria-label', ''))
+            # Walk the buttons once for all three labels, and use the first button found for each one
+            if article['reaction_count'] == 0 or article['comment_count'] == 0 or article['restack_count'] == 0:
+                label_counts = {}
+                for button in soup.find_all('button', {'aria-label': ENGAGEMENT_LABEL_RE}):
+                    match = ENGAGEMENT_LABEL_RE.search(button.get('aria-label', ''))
                     if match:
-                        article['restack_count'] = int(match.group(1))
+                        label_counts.setdefault(ENGAGEMENT_LABEL_FIELDS[match.group(1)], int(match.group(2)))
+                for field, count in label_counts.items():
+                    if article[field] == 0:
+                        article[field] = count
 
             # KJS 2025-11-22 WIP - TO DO: Save the JSON Preload block as a _HTML.JSON file?
             #json_preloads = soup.find('script', {'window._preloads        = JSON.parse\((*)\)'})
@@ -826,8 +1332,12 @@ class DigestGenerator:
         if not html_content:
             return ""
 
-        soup = BeautifulSoup(html_content, 'html.parser')
-        text = soup.get_text()
+        # Leaves out the NON_TEXT_TAGS blocks too, since feedparser no longer sanitizes the RSS summaries for us
+        text = html_text(html_content)
+        if text is None:
+            # Markup the regex doesn't handle (or a bare '<'); let BeautifulSoup sort it out,
+            # with the same parser we always used for summaries
+            text = soup_text(html_content)
 
         # Limit to first 150 characters
         if len(text) > 150:
@@ -835,6 +1345,15 @@ class DigestGenerator:
 
         return text.strip()
 
+    def _count_words(self, html_content):
+        ''' Count the words in article HTML the same way BeautifulSoup get_text().split() does, without building a soup '''
+        text = MARKUP_RE.sub(r'\g<stray>', html_content)
+        if '<' in text:
+            # Leftover '<' means markup the regex doesn't handle (CDATA, a malformed tag, or a bare '<');
+            # let BeautifulSoup sort it out, with the parser we always counted words with
+            return len(soup_text(html_content).split())
+        return len(unescape(text).split())
+
     def _score_articles(self, use_daily_average=True, normalize=NORMALIZE_DEFAULT):
         """
         Score articles based on engagement and content length
@@ -857,68 +1376,39 @@ class DigestGenerator:
         else:
             print(f"\n📊 Scoring articles using Standard model (total engagement + length){norm_text} ...")
 
-        now = datetime.now(timezone.utc)
-
-        for article in self.articles:
-            # Calculate days since publication (minimum 1 to avoid division by zero)
-            days_old = max((now - article['published']).days, 1)
-
-            # Calculate engagement component
-            total_engagement = engagement_score = (
-                (article['reaction_count'] * LIKE_WEIGHT) +
-                (article['comment_count'] * COMMENT_WEIGHT) +
-                (article['restack_count'] * RESTACK_WEIGHT)
-            )
+        now_epoch = time.time()
+        n = len(self.articles)
 
-            # Apply daily average if requested
-            if use_daily_average:
-                engagement_score = engagement_score / days_old
+        # Score all articles at once with numpy arrays instead of looping over the article dicts
+        reactions = np.fromiter((a['reaction_count'] for a in self.articles), dtype=np.float64, count=n)
+        comments  = np.fromiter((a['comment_count'] for a in self.articles), dtype=np.float64, count=n)
+        restacks  = np.fromiter((a['restack_count'] for a in self.articles), dtype=np.float64, count=n)
+        words     = np.fromiter((a['word_count'] for a in self.articles), dtype=np.float64, count=n)
 
-            # Daily average engagement
-            daily_avg = total_engagement / days_old
+        # Calculate days since publication (minimum 1 to avoid division by zero)
+        published = np.fromiter((a['published_epoch'] for a in self.articles), dtype=np.float64, count=n)
+        days_old = np.maximum((now_epoch - published) // SECONDS_PER_DAY, 1)
 
-            # Calculate length component (ensures non-zero score)
-            # Word count contributes a small amount even with zero engagement
-            length_score = (article['word_count'] / 100) * LENGTH_WEIGHT
+        raw_scores, scores = SCORE_ARRAYS(reactions, comments, restacks, words, days_old, use_daily_average, normalize)
 
-            # Combine engagement + length
-            article['raw_score'] = engagement_score + length_score
-
-        # Normalize scores to 1-100 range
-        raw_scores = [a['raw_score'] for a in self.articles]
-
-         # KJS 2025-11-16 handle outlier case (eg 400+) skewing all other scores low
-        min_score = min(min(raw_scores),MAX_RAW_SCORE)
-        max_score = min(max(raw_scores),MAX_RAW_SCORE) 
-
-        # Handle edge case where all scores are the same
-        score_range = max_score - min_score
-        if score_range == 0:
-            for article in self.articles:
-                article['score'] = MAX_RAW_SCORE/2.0  # All get mid-range score
-        else:
-            # KJS 2025-11-22
-            # We may not actually want to normalize the top scores to MAX_RAW_SCORE if all are below MAX_RAW_SCORE.
-            # We might only want to cap articles exceeding MAX_RAW_SCORE so they don't ruin the curve as badly.
-            for article in self.articles:
-                # Normalize to 1-MAX_RAW_SCORE range, or use the raw score but cap it
-                capped_score = min(article['raw_score'],MAX_RAW_SCORE)
-                if normalize:
-                    capped_score = ((capped_score - min_score) / score_range) * 99.0 + 1.0
-                article['score'] = capped_score
+        for article, raw_score, score in zip(self.articles, raw_scores.tolist(), scores.tolist()):
+            article['raw_score'] = raw_score
+            article['score'] = score
 
         # Sort by raw score descending (this way if we've normalized
         # more than one high-scoring post and capped them all at MAX_RAW_SCORE, 
-        # the highest will still come out on top)
-        self.articles.sort(key=lambda x: x['raw_score'], reverse=True)
+        # the highest will still come out on top). A stable sort keeps ties in their original order.
+        order = np.argsort(-raw_scores, kind='stable')
+        self.articles[:] = [self.articles[i] for i in order]
 
         print(f"{GREEN_CHECKMARK_ICON}Scored {len(self.articles)} articles")
 
         # Show top 5 scores
         print("\n🏆 Top 5 articles:")
+        # Reuse the same current time as the scoring above, so the ages shown match the ages scored
         for i, article in enumerate(self.articles[:5], 1):
-            now = datetime.now(timezone.utc)
-            days_old = (now - article['published']).days  # use max (, 1) here?
+            days_old = int((now_epoch - article['published_epoch']) // SECONDS_PER_DAY)  # use max (, 1) here?
+            published_text = article['published'].strftime('%Y-%m-%d %H:%M')
             print(f"   {i}. {article['title'][:75]}") # handle unicode chars in article titles
             restack_text = f", {article['restack_count']} restacks" if article['restack_count']>0 else "" 
             author_text = ' & '.join(article['authors'])
@@ -928,7 +1418,7 @@ class DigestGenerator:
                   f"{article['comment_count']} comments"
                   f"{restack_text} | "
                   f"{article['word_count']} words | "
-                  f"{days_old}d old ({article['published'].strftime('%Y-%m-%d %H:%M')})\n") # KJS Added actual date published
+                  f"{days_old}d old ({published_text})\n") # KJS Added actual date published
 
         return True
 
@@ -936,25 +1426,12 @@ class DigestGenerator:
         ''' remove a featured author or an already-selected wildcard author from the pool '''
         count=0
         if len(author)>0 and len(pool)>0:
-            # Simply removing each article as we find it leaves some behind, because of how the pool indices update
-            # So instead of deleting them as we find them, build the list of articles to delete, then delete them all
-            wc_to_remove=[]
-            for wc in pool:
-                # Check individual author names. Remove any articles by any co-author from the wildcard pool.
-                remove=False
-                for a in wc['authors']:
-                    if a.strip()==author.strip():
-                        remove=True
-                        break
-                if remove:
-                    #if self.verbose: print(f"Marking for removal: {wc['newsletter_name']}, {wc['authors']}")
-                    wc_to_remove.append(wc)
-            
-            # Now that we have found them all, remove them all
-            count=len(wc_to_remove)
-            for wc in wc_to_remove:
-                #if self.verbose: print(f"Removing from wildcard pool: {wc['newsletter_name']}, {wc['authors']}")
-                pool.remove(wc)
+            # Check individual author names. Remove any articles by any co-author from the wildcard pool.
+            # Filter into a new list in one pass instead of removing matches one at a time (each remove is a scan).
+            stripped_author=author.strip()
+            kept=[wc for wc in pool if not any(a.strip()==stripped_author for a in wc['authors'])]
+            count=len(pool)-len(kept)
+            pool=kept
 
         # If an author has more than one featured article, they might already be gone from this list when
         # we call the function on their second featured article. That's not an error or worth a warning.
@@ -1001,23 +1478,27 @@ class DigestGenerator:
         if wildcard_pool:
             # Only pick from the top half of the pool, even if that means we pick fewer than requested
             num_wildcards = min(include_wildcards, int(len(wildcard_pool)/2))
-            i=0
-            while i < num_wildcards and len(wildcard_pool)>0:
-                wildcard = random.choice(wildcard_pool)
-                # KJS 2025-11-23 avoid duplicate 'random' picks
-                i += 1
-                wildcards.append(wildcard)
+
+            # Shuffle the pool once and take picks in that order. Taking the next article in a random order
+            # is the same as a random choice from what's left, without removing anything from the pool.
+            shuffled_pool = self.wildcard_random.sample(wildcard_pool, len(wildcard_pool))
+            # KJS 2025-11-23 limit to 1 wildcard per author by skipping other posts by a picked author
+            # (this also avoids duplicate 'random' picks)
+            picked_authors = set()
+            for wildcard in shuffled_pool:
+                if len(wildcards) >= num_wildcards:
+                    break
                 authors=wildcard['authors']
+                if not picked_authors.isdisjoint(a.strip() for a in authors):
+                    continue
+                wildcards.append(wildcard)
+                picked_authors.update(a.strip() for a in authors if len(a)>0)
                 if self.verbose: 
-                    print(f"\nWildcard pick #{i}: article by {authors} selected")
-                
-                wildcard_pool.remove(wildcard) # so we don't draw it again and get a duplicate
-                # KJS 2025-11-23 limit to 1 wildcard per author by removing other posts by author from the pool
-                # This will also serve to remove the wildcard pick, but let's take it out separately above anyway so the removal message makes more sense
-                for author in authors:
-                    #if self.verbose: print(f"Removing wildcard author {author} from wildcard pool")
-                    wildcard_pool = self._remove_author_from_pool(author, 'wildcard', wildcard_pool)
-                
+                    print(f"\nWildcard pick #{len(wildcards)}: article by {authors} selected")
+
+            # What's left in the pool is everything not by a picked author
+            wildcard_pool = [wc for wc in wildcard_pool if picked_authors.isdisjoint(a.strip() for a in wc['authors'])]
+
         if self.verbose: 
             print(f"\n{len(wildcards)} wildcards selected; {len(wildcard_pool)} remaining in pool")
         
@@ -1025,17 +1506,29 @@ class DigestGenerator:
         wildcards.sort(key=lambda x: x['raw_score'], reverse=True)        
         return wildcards
         
-    def _is_article_in(self, article, articles_subset):
-        ''' Check if an article is in a list by comparing only specific fields that make it unique 
+    def _article_identity(self, article):
+        ''' Key made of only the specific fields that make an article unique, for set lookups
             This lets us detect duplicates created by cloning an article for multiple writers
         '''
-        found=False
-        for a in articles_subset:
-            #if article==a:
-            if article['authors']==a['authors'] and article['title']==a['title'] and article['newsletter_name']==a['newsletter_name'] and article['published']==a['published']:
-                found=True
-                break
-        return found
+        return (tuple(article['authors']), article['title'], article['newsletter_name'], article['published'])
+
+    def _get_newsletter_index(self):
+        ''' Build dicts and sets for looking up newsletters by name, so we don't scan the whole list for each article or author '''
+        if self.newsletter_index is None:
+            url_by_name = {}
+            writer_names = set()
+            newsletter_by_author = {}
+            for newsletter in self.newsletters:
+                url_by_name[newsletter['name']] = newsletter['url']  # if a newsletter is listed more than once, the last one wins
+                writer_names.add(newsletter['writer_name'].lower())
+                writer_names.add(newsletter['publisher'].lower())
+                # Use the publisher name, but only if there is no writer name; the first newsletter that matches wins
+                if len(newsletter['writer_name'])>0:
+                    newsletter_by_author.setdefault(newsletter['writer_name'].lower(), newsletter['name'])
+                elif len(newsletter['publisher'])>0:
+                    newsletter_by_author.setdefault(newsletter['publisher'].lower(), newsletter['name'])
+            self.newsletter_index = {'url_by_name': url_by_name, 'writer_names': writer_names, 'newsletter_by_author': newsletter_by_author}
+        return self.newsletter_index
 
     def _writer_in_newsletter_list(self, writer_name):
         ''' KJS 2025-11-23 check if writer is one of the people listed in the 
@@ -1044,26 +1537,13 @@ class DigestGenerator:
             publisher name even if there is a (different) author name.
             _author_in_newsletter_list below doesn't call that a match.
         '''
-        for newsletter in self.newsletters:
-            # Look for publisher name as well, in case Author column is blank
-            if newsletter['writer_name'].lower()==writer_name.lower() or newsletter['publisher'].lower()==writer_name.lower():
-                return True
-        return False
+        # Look for publisher name as well, in case Author column is blank
+        return writer_name.lower() in self._get_newsletter_index()['writer_names']
 
     def _author_in_newsletter_list(self, writer_name):
         ''' compare specific full writer name to the names of newsletter writers (or, use the publisher name, but only if no writer_name to match) '''
-        match=False
         #if self.verbose: print(f"Checking writer name {writer_name} against newsletter list")
-        for newsletter in self.newsletters:
-            newsletter_name=newsletter['name']
-            if len(newsletter['writer_name'])>0 and writer_name.lower()==newsletter['writer_name'].lower(): 
-                match=True
-            elif len(newsletter['writer_name'])==0 and len(newsletter['publisher'])>0 and writer_name.lower()==newsletter['publisher'].lower(): 
-                match=True
-            if match: 
-                #if self.verbose: print(f"Matched writer name {writer_name} to {newsletter_name} in newsletter list at writer='{newsletter['writer_name']}', publisher='{newsletter['publisher']}'")
-                return newsletter_name
-        return ''
+        return self._get_newsletter_index()['newsletter_by_author'].get(writer_name.lower(), '')
 
     def _find_collaborations(self):
         ''' Find articles that have at least two authors whose names are in the
@@ -1074,6 +1554,7 @@ class DigestGenerator:
         # Then we skip over len(joint_articles) for subsequent selections.
         joint_articles = []
         if self.verbose: print(f"\nChecking for jointly authored articles\n")
+        newsletter_by_author = self._get_newsletter_index()['newsletter_by_author']  # same lookup as _author_in_newsletter_list
         for article in self.articles:
             authors = article['authors']
             if len(authors)<=1:
@@ -1083,7 +1564,7 @@ class DigestGenerator:
             for author in authors:
                 # What we really want are collaborators who are not associated
                 # with the SAME newsletter. We want unique newsletters.
-                newsletter = self._author_in_newsletter_list(author)
+                newsletter = newsletter_by_author.get(author.lower(), '')
                 if len(newsletter)>0 and newsletter not in matched_authors:    
                     matched_authors.append(newsletter)
             if len(matched_authors)>1:
@@ -1097,9 +1578,12 @@ class DigestGenerator:
             for article in joint_articles:
                 new_article_list.append(article)
             #if self.verbose: print(f"Copied {len(joint_articles)} jointly authored articles to top of new article list")
+            # Duplicates were already removed, so each article dict is distinct and we can compare by identity
+            # (a list membership test would compare whole dicts against every article in the new list)
+            joint_ids = {id(article) for article in joint_articles}
             count=len(joint_articles)
             for article in self.articles:
-                if article not in new_article_list:
+                if id(article) not in joint_ids:
                     new_article_list.append(article)
                     #if self.verbose: print(f"{count} Copied solo-authored article to new article list")
                 #else:
@@ -1118,23 +1602,29 @@ class DigestGenerator:
 
         return joint_articles
 
+    def _article_key(self, article):
+        ''' Hashable key for an article that is equal for two articles exactly when the article dicts are equal '''
+        return tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in article.items()))
+
     def _remove_duplicates(self):
         ''' Remove duplicate articles (repeats from -xma) from our list of articles '''
         
         # We could get duplicates if our list has the same newsletter listed 
         # with two different authors, and they co-wrote an article. 
         # Be careful though about authors who always reuse the same article title, just on different dates.
-        dups_to_remove=[]
+        # Walk the list backwards so that, as before, the last copy of a duplicate is the one we keep
         article_count_before=len(self.articles)
-        for i in range(1,article_count_before):
-            article=self.articles[i]
-            if article in self.articles[:i]:
+        seen_keys=set()
+        kept=[]
+        for article in reversed(self.articles):
+            key=self._article_key(article)
+            if key in seen_keys:
                 #if self.verbose: print(f"Identified duplicate article for {article['newsletter_name']} and {article['authors']} {article['published']}")
-                dups_to_remove.append(article)  # confirm this will only remove one of the instances
-
-        for article in dups_to_remove:
-            #if self.verbose: print(f"Removing duplicate article for {article['newsletter_name']} and {article['authors']} ")
-            self.articles.remove(article) # only deletes first one it finds that matches
+                continue
+            seen_keys.add(key)
+            kept.append(article)
+        kept.reverse()
+        self.articles[:]=kept
         article_count_after=len(self.articles)
 
         articles_removed=article_count_before-article_count_after
@@ -1221,9 +1711,10 @@ class DigestGenerator:
         # e.g. instead of newsletter_category, maybe author, or no categorization,
         # just in order by score
         categorized = defaultdict(list)
+        already_placed = {self._article_identity(a) for a in featured+wildcards+joint_articles}
         for article in self.articles:
             #if article not in featured, joint, or wildcards:
-            if not self._is_article_in(article, featured) and not self._is_article_in(article, wildcards) and not self._is_article_in(article, joint_articles):
+            if self._article_identity(article) not in already_placed:
                 categorized[article['newsletter_category']].append(article)
         
         return joint_articles, featured, wildcards, categorized
@@ -1238,7 +1729,8 @@ class DigestGenerator:
         return icon
 
     def generate_digest_html(self, joint_articles, featured_articles, wildcard_articles, categorized_articles, days_back, scoring_method, show_scores, normalized, collapse_categories, joint_authors):
-        """Generate Substack-ready HTML digest with clean formatting"""
+        """Generate Substack-ready HTML digest with clean formatting.
+        Returns the list of HTML pieces (lines); save_digest_html writes them out without joining them first."""
 
         print(f"\n📝 Generating digest HTML ...")
 
@@ -1246,10 +1738,11 @@ class DigestGenerator:
         html_parts = ["<html>","<body>"] 
 
         # Container with max-width for readability (why not use 100% or EM/VW units?)
-        html_parts.append('<div style="font-family: Georgia, serif; max-width: 700px; margin: 0 auto; line-height: 1.7; color: #1a1a1a;">')
+        html_parts.append(DIGEST_CONTAINER_DIV)
 
         # Header
         now = datetime.now() # in local time, not UTC, for display purposes (switch to UTC?)
+        self.render_epoch = now.timestamp()  # same instant, used for every article's "days ago"
         scoring_label = "Daily Average" if scoring_method == 'daily_average' else "Standard"
         lookback_text = f"{days_back} day lookback" if days_back>0 else ""
         wildcard_text = f"• {len(wildcard_articles)} Wildcard Pick(s) " if len(wildcard_articles)>0 else "" # KJS 2025-11-17 added
@@ -1261,33 +1754,21 @@ class DigestGenerator:
         # remove this help text from their article.
         collapse_text=f"Click the arrow above this section to expand it and view the articles." if collapse_categories else ""
 
-        html_parts.append(f'''
-        <div style="text-align: center; padding: 40px 20px; margin-bottom: 40px;">
-            <h1 style="font-size: 36px; font-weight: 700; color: #1a1a1a; margin: 0 0 10px 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;">Newsletter Digest</h1>
-            <div style="font-size: 16px; color: #666; margin-bottom: 8px;">{now.strftime('%A, %B %d, %Y')}</div>
-            <div style="font-size: 14px; color: #666; margin-bottom: 8px;">{collab_text }{len(featured_articles)} Featured Articles {wildcard_text}• {len(self.articles)} Total Articles</div>
-            <div style="font-size: 13px; color: #888; font-style: italic;">{scoring_label} scoring (engagement + length) {norm_text}<br>{lookback_text} • {len(self.newsletters)} newsletters</div>
-        </div>
-        ''')
-        
-        # KJS 2025-11-16 Inline styles for article headers (consider adding id={id} so we can add clickable TOC later? or use collapsible sections instead, since neither will work in Substack)
-        h2_style_start=f'<br> <hr><h2 style="font-size: 24px; font-weight: 700; color: #1a1a1a; margin: 0 0 0 0; font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;" title="{collapse_text}">'
-        h2_style_end='</h2><hr style="margin-bottom: 10px">'
-        # Adding spacing before and after H2 with <p> or <div> or <br> or style padding & margin works well in a normal browser.
-        # But Substack ignores padding & margin and does not respect the spacing before or after the end of the H2 with any of 
-        # these methods. Haven't yet found a way to make it work well. Will keep experimenting.
+        html_parts.append(DIGEST_HEADER_TEMPLATE.format(date=now.strftime('%A, %B %d, %Y'), collab_text=collab_text,
+                                                        featured_count=len(featured_articles), wildcard_text=wildcard_text,
+                                                        total_count=len(self.articles), scoring_label=scoring_label, norm_text=norm_text,
+                                                        lookback_text=lookback_text, newsletter_count=len(self.newsletters)))
 
         # Put collaborative (joint) articles first
         if joint_authors and len(joint_articles)>0:
             if collapse_categories:
                 html_parts.append('<details><summary>')                
-            html_parts.append(f'{h2_style_start}Jointly-Authored Collaborative Articles ({len(joint_articles)}){h2_style_end}')
+            html_parts.append(H2_TEMPLATE.format(heading=f'Jointly-Authored Collaborative Articles ({len(joint_articles)})', collapse_text=collapse_text))
             if collapse_categories:
                 html_parts.append('</summary>')                
 
-            for i, article in enumerate(joint_articles, 1):
-                icon=self._article_icons(article, "", joint=True)
-                html_parts.append(self._format_article_featured(article, number=i, icon=icon, show_scores=show_scores))
+            html_parts.extend(self._format_article_featured(article, number=i, icon=self._article_icons(article, "", joint=True), show_scores=show_scores)
+                              for i, article in enumerate(joint_articles, 1))
 
             if collapse_categories:
                 html_parts.append('</details>')                
@@ -1296,15 +1777,14 @@ class DigestGenerator:
         if featured_articles and len(featured_articles)>0:
             if collapse_categories:
                 html_parts.append('<details><summary>')                
-            html_parts.append(f'{h2_style_start}Featured Articles ({len(featured_articles)}){h2_style_end}')
+            html_parts.append(H2_TEMPLATE.format(heading=f'Featured Articles ({len(featured_articles)})', collapse_text=collapse_text))
             if collapse_categories:
                 html_parts.append('</summary>')                
 
-            for i, article in enumerate(featured_articles, 1):
-                # TO DO: Check if it's jointly authored (relevant if we are not breaking out
-                # jointly authored articles to the separate first section)
-                icon=self._article_icons(article, FEATURE_ARTICLE_ICON, joint=False)
-                html_parts.append(self._format_article_featured(article, number=i, icon=icon, show_scores=True))
+            # TO DO: Check if it's jointly authored (relevant if we are not breaking out
+            # jointly authored articles to the separate first section)
+            html_parts.extend(self._format_article_featured(article, number=i, icon=self._article_icons(article, FEATURE_ARTICLE_ICON, joint=False), show_scores=True)
+                              for i, article in enumerate(featured_articles, 1))
 
             if collapse_categories:
                 html_parts.append('</details>')                
@@ -1313,15 +1793,14 @@ class DigestGenerator:
         if wildcard_articles and len(wildcard_articles)>0:
             if collapse_categories:
                 html_parts.append('<details><summary>')                
-            html_parts.append(f'{h2_style_start}Wildcard Pick{"s" if len(wildcard_articles)>1 else ""} ({len(wildcard_articles)}){h2_style_end}')
+            html_parts.append(H2_TEMPLATE.format(heading=f'Wildcard Pick{"s" if len(wildcard_articles)>1 else ""} ({len(wildcard_articles)})', collapse_text=collapse_text))
             if collapse_categories:
                 html_parts.append('</summary>')                
 
-            for i, article in enumerate(wildcard_articles, 1):
-                # TO DO: Check if it's jointly authored (relevant if we are not breaking out
-                # jointly authored articles to the separate first section)
-                icon=self._article_icons(article, WILDCARD_ARTICLE_ICON, joint=False)
-                html_parts.append(self._format_article_featured(article, number=(i if len(wildcard_articles)>1 else None), icon=icon, show_scores=show_scores))
+            # TO DO: Check if it's jointly authored (relevant if we are not breaking out
+            # jointly authored articles to the separate first section)
+            html_parts.extend(self._format_article_featured(article, number=(i if len(wildcard_articles)>1 else None), icon=self._article_icons(article, WILDCARD_ARTICLE_ICON, joint=False), show_scores=show_scores)
+                              for i, article in enumerate(wildcard_articles, 1))
 
             if collapse_categories:
                 html_parts.append('</details>')                
@@ -1333,24 +1812,21 @@ class DigestGenerator:
                 if articles:
                     if collapse_categories:
                         html_parts.append('<details><summary>')                
-                    html_parts.append(f'{h2_style_start}{category} ({len(articles)}){h2_style_end}') # KJS add category count to title
+                    html_parts.append(H2_TEMPLATE.format(heading=f'{category} ({len(articles)})', collapse_text=collapse_text)) # KJS add category count to title
                     if collapse_categories:
                         html_parts.append('</summary>')                
 
                     # TO DO: If not showing scores, consider grouping by newsletter and then ordering by date descending
-                    for article in articles:
-                        # TO DO: Check if it's jointly authored (relevant if we are not breaking out
-                        # jointly authored articles to the separate first section)
-                        icon=self._article_icons(article, CATEGORY_ARTICLE_ICON, joint=False)
-                        html_parts.append(self._format_article_compact(article,show_scores=show_scores,icon=icon))
+                    # TO DO: Check if it's jointly authored (relevant if we are not breaking out
+                    # jointly authored articles to the separate first section)
+                    html_parts.extend(self._format_article_compact(article,show_scores=show_scores,icon=self._article_icons(article, CATEGORY_ARTICLE_ICON, joint=False))
+                                      for article in articles)
                     if collapse_categories:
                         html_parts.append('</details>')                
 
-        html_parts.append('</div>')
-        html_parts.append('</body>')
-        html_parts.append('</html>')
+        html_parts.extend(('</div>', '</body>', '</html>'))
 
-        return '\n'.join(html_parts)
+        return html_parts
 
     def _format_article_line0(self, article, number=None, icon=""):
         '''
@@ -1365,31 +1841,28 @@ class DigestGenerator:
         if len(icon)>0:
             title_text = f"{icon} {title_text}"
         
-        line0_style_start='<span style="font-size: 20px; font-weight: 700; line-height: 1.3; margin-bottom: 8px;">'
-        line0_style_end='</span>'
-
         # create title hyperlink; add mouseover text for accessibility
-        line0_content = f"<a title=\"{article['title']}\" href=\"{article['link']}\" style=\"color: #1a1a1a; text-decoration: none;\">{title_text}</a>"
+        line0_content = ARTICLE_TITLE_LINK_TEMPLATE.format(title=article['title'], link=article['link'], text=title_text)
 
-        return f"{line0_style_start}{line0_content}{line0_style_end}"
+        return f"{ARTICLE_LINE0_STYLE_START}{line0_content}{ARTICLE_LINE0_STYLE_END}"
+
+    def _format_article_compact_line0(self, article, icon=""):
+        ''' Same as _format_article_line0 for compact articles, which are never numbered (only an icon, if any) '''
+        title = article['title']
+        title_text = f"{icon} {title}" if icon else title
+        line0_content = ARTICLE_TITLE_LINK_TEMPLATE.format(title=title, link=article['link'], text=title_text)
+        return f"{ARTICLE_LINE0_STYLE_START}{line0_content}{ARTICLE_LINE0_STYLE_END}"
         
     def _format_article_line1(self, article, add_newsletter_links=True):
         ''' KJS 2025-11-13 Refactored line1 formatting out from featured and compact functions
         Handles newsletter name, author name, date (days ago and publication date) '''
-        
-        ''' Style definitions for line1, shared among featured/wildcard and compact articles '''
-        ARTICLE_LINE1_STYLE_START="<span style=\"margin-bottom: 40px; padding: 15px 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; font-size: 18px; color: #666; line-height: 1.6;\">"
-        ARTICLE_LINE1_STYLE_END="</span>"
 
         # First line: Newsletter name, author(s), and date
         #first_line_parts = [article["newsletter_name"]] 
         # KJS 2025-11-16 make newsletter name a hyperlink
+        newsletter_index = self._get_newsletter_index()  # one lookup for the newsletter and all of its authors
         newsletter_name = article['newsletter_name']
-        newsletter_url = ''
-        for newsletter in self.newsletters:
-            if newsletter['name']==newsletter_name:
-                newsletter_url = newsletter['url']
-                #if self.verbose: print(f"Matched newsletter {newsletter_name} to url {newsletter_url}")
+        newsletter_url = newsletter_index['url_by_name'].get(newsletter_name, '')
         if len(newsletter_url)>0 and add_newsletter_links:
             newsletter_link = f"In <a title=\"Newsletter: {newsletter_name}\" href=\"{newsletter_url}\" style=\"color: #1a1a1a; font-weight: bold; text-decoration: none;\">{newsletter_name}</a>"
         else:
@@ -1398,62 +1871,67 @@ class DigestGenerator:
 
         # KJS Prepare to hyperlink the first author's name to their Substack profile handle
         if article.get('authors') and len(article['authors']) > 0:
-            # Only BOLD the names of matched writers for this article.
-            formatted_authors=[]
-            for author in article['authors']:
-                author_name = f"<b>{author}</b>" if len(self._author_in_newsletter_list(author))>0 else author
-                formatted_authors.append(author_name)
-            author_text = ' & '.join(formatted_authors)
+            # Only BOLD the names of matched writers for this article (same test as _author_in_newsletter_list).
+            newsletter_by_author = newsletter_index['newsletter_by_author']
+            author_text = ' & '.join([f"<b>{author}</b>" if newsletter_by_author.get(author.lower()) else author
+                                      for author in article['authors']])
             first_line_parts.append(f"by <a style=\"color: #1a1a1a; font-weight: bold; text-decoration: none;\" title=\"Author: {author_text}\">{author_text}</a>")
         # Otherwise author(s) are unknown, maybe no byline in the article.
         # Possible contingency: use the author name and handle from the newsletter, if it's available?
 
-        days_ago = (datetime.now(timezone.utc) - article['published']).days  # use max (, 1) here?
+        days_ago = int((self.render_epoch - article['published_epoch']) // SECONDS_PER_DAY)  # use max (, 1) here?
 
-        first_line_parts.append(f" {days_ago}d ago ({article['published'].strftime('%Y-%m-%d %H:%M %Z')})") # KJS Add actual date published (show it's UTC)
+        first_line_parts.append(f" {days_ago}d ago ({article['published_utc_text']})") # KJS Add actual date published (show it's UTC)
 
-        line1_style_start=ARTICLE_LINE1_STYLE_START
-        line1_style_end=ARTICLE_LINE1_STYLE_END
-        line1_content = f'{" • ".join(first_line_parts)}'
+        line1_content = BULLET_SEPARATOR.join(first_line_parts)
 
-        return f'{line1_style_start}{line1_content}{line1_style_end}'
+        return f'{ARTICLE_LINE1_STYLE_START}{line1_content}{ARTICLE_LINE1_STYLE_END}'
               
     def _format_engagement_metrics_and_score(self, article, show_scores=SHOW_SCORES_DEFAULT, include_category=False):
         ''' KJS 2025-11-13 Refactored formatting of engagement metrics out from featured and compact functions '''
-        ENGAGEMENT_STYLE_START = '<span style="font-size: 16px; color: #666; line-height: 1.6;">'
-        ENGAGEMENT_STYLE_END = '</span>'
+
+        # The counts are ints from the time the article was built (fetch or CSV read)
+        reaction_count = article['reaction_count']
+        comment_count = article['comment_count']
+        restack_count = article['restack_count']
+        word_count = article['word_count']
+
+        # Nothing to show? Skip building the pieces (common for brand-new articles in the category sections)
+        if (not include_category and reaction_count <= 0 and comment_count <= 0 and restack_count <= 0
+                and word_count <= 0 and (not show_scores or article.get('score', 0) <= 0)):
+            return EMPTY_ENGAGEMENT_HTML
 
         # Add engagement metrics if present and non-zero
-        engagement_html = ENGAGEMENT_STYLE_START
+        # Collect the pieces in a list and join them once at the end
+        engagement_parts = [ENGAGEMENT_STYLE_START]
         if include_category:
             cat = article['newsletter_category']
-            category_text = f"Category: {cat} • "
-            engagement_html += category_text
+            category_text = f"Category: {cat}{BULLET_SEPARATOR}"
+            engagement_parts.append(category_text)
 
         metrics = []
-        if article['reaction_count'] > 0:
-            metrics.append(f"{int(article['reaction_count']):,} likes")
-        if article['comment_count'] > 0:
-            metrics.append(f"{int(article['comment_count']):,} comments")
-        if article['restack_count'] > 0:
-            metrics.append(f"{int(article['restack_count']):,} restacks")
+        if reaction_count > 0:
+            metrics.append(f"{reaction_count:,} likes")
+        if comment_count > 0:
+            metrics.append(f"{comment_count:,} comments")
+        if restack_count > 0:
+            metrics.append(f"{restack_count:,} restacks")
 
         if metrics:
-            engagement_html += f'{" • ".join(metrics)}'
+            engagement_parts.append(BULLET_SEPARATOR.join(metrics))
             
         # Add word count and score
-        word_count = int(article.get('word_count', 0))
         if word_count > 0:
             # KJS 2025-11-17 Avoid the leading * if there are no metrics (no likes, comments, or restacks)
-            words_line = f'{" • " if len(metrics)>0 else ""}{word_count:,} words'
-            engagement_html += words_line
+            words_line = f'{BULLET_SEPARATOR if len(metrics)>0 else ""}{word_count:,} words'
+            engagement_parts.append(words_line)
         if show_scores:
             score = article.get('score', 0)
-            score_line = f' • Score: {score:.1f}' if score>0 else ''  # KJS 2025-11-17 only show score if non-zero
-            engagement_html += score_line
-        engagement_html += ENGAGEMENT_STYLE_END
+            score_line = f'{BULLET_SEPARATOR}Score: {score:.1f}' if score>0 else ''  # KJS 2025-11-17 only show score if non-zero
+            engagement_parts.append(score_line)
+        engagement_parts.append(ENGAGEMENT_STYLE_END)
 
-        return engagement_html
+        return ''.join(engagement_parts)
 
     def _format_article_summary(self, article):
         ''' Format article summary (only used on featured and wildcard articles, at present). 
@@ -1485,6 +1963,7 @@ class DigestGenerator:
         summary_html = self._format_article_summary(article)
 
         # Build HTML - treat the title like a header
+        # (An f-string like this is assembled in one step; it measured faster than ''.join() over the same pieces.)
         return f'''
         <h4>{line0_html}</h4>
         <div>{line1_html}
@@ -1497,7 +1976,7 @@ class DigestGenerator:
 
         """Format a compact article with fewer details, no numbering"""
         # Title as hyperlink
-        line0_html = self._format_article_line0(article, number=None, icon=icon)
+        line0_html = self._format_article_compact_line0(article, icon=icon)
 
         # First line: Newsletter name, author(s), and date
         line1_html = self._format_article_line1(article)
@@ -1508,7 +1987,7 @@ class DigestGenerator:
         
         # No summary for compact
 
-        # Build HTML
+        # Build HTML (an f-string, as in _format_article_featured; a module-level str.format_map template measured much slower)
         return f'''
         <h4>{line0_html}</h4>
         <div>
@@ -1518,16 +1997,16 @@ class DigestGenerator:
         </div>
         '''
 
-    def _count_article_for_newsletter(self, name):
-        ''' count one more article found for a newsletter '''
+    def _count_articles_for_newsletters(self, newsletter_counts):
+        ''' add the article counts found per newsletter name (a Counter) to the newsletter list '''
         for newsletter in self.newsletters:
-            if newsletter['name']==name:
-                newsletter['article_count'] += 1
-                return 1
+            # Only the first newsletter with a given name gets its count
+            count = newsletter_counts.pop(newsletter['name'], 0)
+            newsletter['article_count'] += count
 
-        print(f"{WARNING_TRIANGLE_ICON}Logic error: article in newsletter {name} cannot be counted, not found in list")
-        print(f"{self.newsletters}")
-        return 0
+        for name in newsletter_counts:
+            print(f"{WARNING_TRIANGLE_ICON}Logic error: article in newsletter {name} cannot be counted, not found in list")
+            print(f"{self.newsletters}")
                 
     def _string_to_array(self, input_string: str, delimiter: str = "&") -> list[str]:
         '''
@@ -1547,6 +2026,7 @@ class DigestGenerator:
 
     def _read_articles_from_csv(self, csv_path):
         ''' Read digest article data from CSV file for reprocessing (reformatting) '''
+        import pandas as pd
 
         # Ensure the dataframe always has these columns, even if missing in the CSV file
         articles_df = pd.DataFrame()
@@ -1577,37 +2057,34 @@ class DigestGenerator:
             return -1
             
         articles=[]
+        seen_keys=set()  # keys of the articles read so far, for fast duplicate checks
+        newsletter_counts=Counter()  # articles per newsletter name, added to the newsletters once at the end
         newsletters=[]
         try:
-            # Repopulate the articles object from the dataframe
-            for i in range(len(articles_df)):
+            # Strip the text columns all at once; empty cells become '' (not 'nan')
+            for col in CSV_TEXT_COLUMNS:
+                articles_df[col] = articles_df[col].astype('string').str.strip().fillna('')
+
+            # Repopulate the articles object from the dataframe.
+            # Walk plain row tuples of just the columns we use; per-cell .at lookups are slow on big files.
+            # Ignore the Writer and UTC Date columns we added for convenience of use of the CSV for other purposes.
+            rows = articles_df[CSV_READ_COLUMNS].itertuples(index=False, name=None)
+            for (writer_name, writer_handle, publisher_name, title, link, name, url, authors_concatenated,
+                 category, date_published, summary, words, likes, comments, restacks, raw_score, score) in rows:
                 
                 # Extract article data from file data
-                #   Category	Date Published	Authors	Article Link	Newsletter Link	
-                #   Summary	Words	Likes	Comments	Restacks	Raw Score	Score
                 # 'Article Link' contains article title and link in markdown format
                 # 'Newsletter Link' contains newsletter name and url in markdown format
 
-                # KJS 2025-11-17 Incorporate author and handle
-                writer_name = str(articles_df.at[i,'Writer Name']).strip()
-                writer_handle = str(articles_df.at[i,'Writer Handle']).strip()
-                publisher_name = str(articles_df.at[i,'Publisher']).strip()
-                title = str(articles_df.at[i,'Article Title']).strip()
-                link = str(articles_df.at[i,'Article URL']).strip()
-                name = str(articles_df.at[i,'Newsletter Name']).strip()
-                url = str(articles_df.at[i,'Newsletter URL']).strip()      
+                # KJS 2025-11-17 Incorporate author and handle (text columns were already stripped above)
 
                 # 2025-12-11 Unpack the Authors column which was written out as name1 & name2 & ...
                 # so that we have the array of authors we need for proper digest reuse processing
-                #authors = str(articles_df.at[i,'Authors']).strip()
-                authors_concatenated = str(articles_df.at[i,'Authors']).strip()
                 authors = self._string_to_array(authors_concatenated, "&")
                 #if self.verbose: print(f"Converted {authors_concatenated} to {authors}")
 
-                category = str(articles_df.at[i,'Category']).strip()                
-                datetime_value = datetime.fromisoformat(articles_df.at[i,'Date Published'])
-                # Ignore the Writer and UTC Date columns we added for convenience of use of the CSV for other purposes.
-                summary = str(articles_df.at[i,'Summary']).strip()
+                # Keep fromisoformat here: the column can mix UTC offsets, which parse_dates would leave as strings
+                datetime_value = datetime.fromisoformat(date_published)
 
                 # First, add the newsletter if new. Ignore author name for now (we are not matching) and collections.
                 self._add_newsletter(name, url, writer_name=writer_name, writer_handle=writer_handle, category=category, collections='', publisher_name='')  # partially blank
@@ -1618,6 +2095,8 @@ class DigestGenerator:
                     'link':                link,
                     'summary':             summary,
                     'published':           datetime_value,
+                    'published_epoch':     datetime_value.timestamp(),
+                    'published_utc_text':  datetime_value.strftime(PUBLISHED_UTC_FORMAT),
                     'publisher':           publisher_name,
                     'newsletter_name':     name, 
                     'newsletter_link':     url, 
@@ -1625,26 +2104,30 @@ class DigestGenerator:
                     'writer_handle':       writer_handle, 
                     'newsletter_category': category,
                     'authors':             authors, 
-                    'word_count':          int(articles_df.at[i,'Words']),
-                    'comment_count':       int(articles_df.at[i,'Comments']),
-                    'reaction_count':      int(articles_df.at[i,'Likes']),
-                    'restack_count':       int(articles_df.at[i,'Restacks']),
+                    'word_count':          int(words),
+                    'comment_count':       int(comments),
+                    'reaction_count':      int(likes),
+                    'restack_count':       int(restacks),
                     'filename':            '',  # unused here
-                    'raw_score':           articles_df.at[i,'Raw Score'],
-                    'score':               articles_df.at[i,'Score'],
+                    'raw_score':           raw_score,
+                    'score':               score,
                 }
                 # 2025-12-12 Beware of duplicates (e.g. if this file was created with the -xma option)
-                if not article in articles:
+                key = self._article_key(article)
+                if key not in seen_keys:
+                    seen_keys.add(key)
                     articles.append(article)            
 
-                # Need to find the right newsletter to bump its count.
-                self._count_article_for_newsletter(name)
+                # Count it for its newsletter (the newsletters get the totals after the loop)
+                newsletter_counts[name] += 1
 
         except Exception as e:        
             # Most likely: this isn't a valid saved article data file - one or more column names were not found
-            print(f"\n{RED_X_FAILURE_ICON}EXCEPTION while processing CSV digest article data file '{csv_path}': \n{e}\n")
-            traceback.print_exc()
+            print(f"\n{RED_X_FAILURE_ICON}EXCEPTION while processing CSV digest article data file '{csv_path}': \n{type(e).__name__}: {e}\n")
+            if self.verbose: traceback.print_exc()
             return (-1)
+
+        self._count_articles_for_newsletters(newsletter_counts)
             
         # Sort the list of articles in the order that the data processor wants it 
         # - by raw score descending
@@ -1660,39 +2143,41 @@ class DigestGenerator:
        
         return len(self.articles)
 
-    def _build_article_df(self, i, articles_df, article, writer_name):
-        ''' Build dataframe row for a single article and writer, to go into the output article CSV file '''
+    def _build_article_row(self, article, writer_name):
+        ''' Build the row (a dict keyed by column name) for a single article and writer, to go into the output article CSV file '''
                 
         # Put these columns in the order SWAI feed sheet needs: author first, then date descending
         # Save date in two different formats: one with proper ISO format, another that Excel and Google Sheets can handle
-        articles_df.at[i,'Writer']          = writer_name
-        articles_df.at[i,'Date Published']  = article['published'].isoformat()
-        articles_df.at[i,'UTC Date']        = article['published'].strftime('%Y-%m-%d %H:%M %Z')
-        articles_df.at[i,'Category']        = article['newsletter_category']
-        articles_df.at[i,'Authors']         = ' & '.join(article['authors'])
-        
-        articles_df.at[i,'Article Title']   = article['title'] # Store separately so we don't have to re-parse markdown
-        articles_df.at[i,'Article URL']     = article['link']
-        articles_df.at[i,'Article Link']    = make_markdown_link(article['title'],article['link'])
+        return {
+            'Writer':          writer_name,
+            'Date Published':  article['published'].isoformat(),
+            'UTC Date':        article['published_utc_text'],
+            'Category':        article['newsletter_category'],
+            'Authors':         ' & '.join(article['authors']),
+
+            'Article Title':   article['title'], # Store separately so we don't have to re-parse markdown
+            'Article URL':     article['link'],
+            'Article Link':    make_markdown_link(article['title'], article['link']),
 
-        # Not sure we need this for reuse? leave it out for now
-        #articles_df.at[i,'Publisher'] = article['publisher_name']
-        articles_df.at[i,'Newsletter Name'] = article['newsletter_name']
-        articles_df.at[i,'Newsletter URL']  = article['newsletter_link']
-        articles_df.at[i,'Newsletter Link'] = make_markdown_link(article['newsletter_name'],article['newsletter_link'])
+            # Not sure we need this for reuse? leave it out for now
+            #'Publisher':      article['publisher_name'],
+            'Newsletter Name': article['newsletter_name'],
+            'Newsletter URL':  article['newsletter_link'],
+            'Newsletter Link': make_markdown_link(article['newsletter_name'], article['newsletter_link']),
 
-        articles_df.at[i,'Writer Name'] = article['writer_name']      # from newsletter CSV file
-        articles_df.at[i,'Writer Handle'] = article['writer_handle']  # from newsletter CSV file
+            'Writer Name':     article['writer_name'],      # from newsletter CSV file
+            'Writer Handle':   article['writer_handle'],    # from newsletter CSV file
 
-        articles_df.at[i,'Summary']   = article['summary']
+            'Summary':         article['summary'],
 
-        articles_df.at[i,'Words']     = int(article['word_count'])
-        articles_df.at[i,'Likes']     = int(article['reaction_count'])
-        articles_df.at[i,'Comments']  = int(article['comment_count'])
-        articles_df.at[i,'Restacks']  = int(article['restack_count'])
+            'Words':           int(article['word_count']),
+            'Likes':           int(article['reaction_count']),
+            'Comments':        int(article['comment_count']),
+            'Restacks':        int(article['restack_count']),
 
-        articles_df.at[i,'Raw Score'] = article['raw_score']
-        articles_df.at[i,'Score']     = article['score']
+            'Raw Score':       article['raw_score'],
+            'Score':           article['score'],
+        }
 
     def _save_article_lists_to_csv(self, debug_digest_file, joint, featured, wildcards, categorized):
         ''' Save the data to the CSV file specified '''
@@ -1720,33 +2205,27 @@ class DigestGenerator:
                 print(f"{len(self.articles)} articles in the main list\n")
                 # continue anyway
 
-            i=0
-            articles_df = pd.DataFrame(columns=DEBUG_COLUMNS)
+            rows=[]
             for article in articles_in_order:
                 writer_name = article['writer_name']  # no author name expansions for this file
-                self._build_article_df(i, articles_df, article, writer_name)
-                articles_df.at[i,'Type'] = article['Type']                
-                i += 1
-
-            #if self.verbose: 
-            #    print(f"Top of debug articles dataframe:")
-            #    print(articles_df.head())
-            #    print(articles_df.describe())
+                row = self._build_article_row(article, writer_name)
+                row['Type'] = article['Type']
+                rows.append(row)
                     
         except Exception as e:        
             print(f"\n{RED_X_FAILURE_ICON}EXCEPTION while preparing data to write to CSV debug article file '{debug_digest_file}': \n{e}\n")
             if self.verbose: traceback.print_exc()
             return (-1)
             
-        # articles_df is ready to write out
+        # rows are ready to write out
         if self.verbose:
-            print(f"{len(articles_df)} dataframe rows ready to write to CSV debug file")
+            print(f"{len(rows)} rows ready to write to CSV debug file")
         try:
-            articles_df.to_csv(debug_digest_file, index=False)
+            save_rows_to_csv(rows, DEBUG_COLUMNS, debug_digest_file)
 
             print(f"\n💾 Article data saved to: {debug_digest_file}.")
             print("   This file is in the exact order used to generate the HTML file and can be used for further analysis.\n")
-            return len(articles_df)
+            return len(rows)
         
         except (FileNotFoundError, IOError, OSError, PermissionError) as e:        
             print(f"\n{RED_X_FAILURE_ICON}ERROR: Writing to CSV article debug file '{debug_digest_file}' failed: \n{e}\n")
@@ -1762,45 +2241,46 @@ class DigestGenerator:
             Dataframe is sorted ascending by author name if max_per_author=1
         '''
         
-        # Save articles to a dataframe if we have any
+        # Save articles to the file if we have any
         if not self.articles: 
             print(f"{RED_X_FAILURE_ICON}ERROR: No articles to save to CSV file {csv_digest_file}")
             return 0
         if self.verbose:
-            print(f"{len(self.articles)} articles to process for dataframe and save to CSV file ...")
+            print(f"{len(self.articles)} articles to process and save to CSV file ...")
         
         # Ignore len(self.articles)<1 and go ahead & make an empty file in the right format
-        # Save the dataframe to the CSV file specified
-        articles_df = pd.DataFrame()
+        # Save the rows to the CSV file specified
+        rows=[]
         try:
             # Rename and reformat columns, eg the list of authors, and make two links display-ready (markdown-compatible)            
-            i=0
             if self.verbose: 
                 if expand_multiple_authors:
                     print(f"For multi-author articles, output CSV will have one row per writer name matched in newsletters file.\n")
                 #else:
                 #    print(f"Multi-author articles will not be expanded in the output CSV - one row per article.\n")
+            writer_names = self._get_newsletter_index()['writer_names']  # same lookup as _writer_in_newsletter_list
 
             for article in self.articles:
-                # To expand_multiple_authors, repeat the steps to add a dataframe row with each author's
+                # To expand_multiple_authors, repeat the steps to add a row with each author's
                 # name as the Writer, but only if that author's name appears in the newsletters list
                 if expand_multiple_authors and len(article['authors'])>1:
                     #if self.verbose: print(f"Checking writer names in newsletter file for adding multiple rows to CSV: {article['authors']} {article['title']}")
                     writers_added=[]
+                    article_row=None  # build the row once; each matched writer gets a copy with their name as the Writer
                     for writer_name in article['authors']:
-                        if self._writer_in_newsletter_list(writer_name):
+                        if writer_name.lower() in writer_names:
                             #if self.verbose: print(f"Adding row to CSV for writer {writer_name} - matched in newsletters file")
-                            self._build_article_df(i, articles_df, article, writer_name)
+                            if article_row is None:
+                                article_row = self._build_article_row(article, writer_name)
+                            rows.append({**article_row, 'Writer': writer_name})
                             writers_added.append((writer_name,article['newsletter_name']))
-                            i += 1
                         #else:
                             #if self.verbose: print(f"Not adding row to CSV for writer {writer_name} - not matched in newsletters file")
                     #if self.verbose: print(f"Added {len(writers_added)} article data rows for {writers_added} on {article['title']} (full author list: {article['authors']} )")
                 else:
                     writer_name = article['writer_name']
                     # shouldn't need to check self._writer_in_newsletter_list(writer_name)
-                    self._build_article_df(i, articles_df, article, writer_name)
-                    i += 1
+                    rows.append(self._build_article_row(article, writer_name))
                     #if self.verbose: print(f"Added one article data row for {writer_name},{article['newsletter_name']} on {article['title']} (one author, or not expanding)")
                     
         except Exception as e:        
@@ -1808,22 +2288,20 @@ class DigestGenerator:
             #if self.verbose: traceback.print_exc()
             return (-1)
             
-        # articles_df is ready to write out
+        # rows are ready to write out
         if self.verbose:
-            print(f"{len(articles_df)} dataframe rows ready to write to CSV file")
+            print(f"{len(rows)} rows ready to write to CSV file")
         try:
             # Sort the file in the desired order for lookups - author ascending, then date descending
             # if we are limiting to one article per author+newsletter
             # (OK to have more than one per author if different newsletters - just sort by date)
             if sort_data:
-                len_before=len(articles_df)
-                articles_df=articles_df.sort_values(['Writer', 'Date Published'], ascending=[True, False])
-                len_after=len(articles_df)
-                if len_before != len_after: 
-                    print(f"Articles_df row counts differ: before={len_before}, after={len_after}")
+                # Both sorts are stable, so this orders by date within each writer and keeps ties in their original order
+                rows.sort(key=lambda row: row['Date Published'], reverse=True)
+                rows.sort(key=lambda row: row['Writer'])
 
             # all done; save to file
-            articles_df.to_csv(csv_digest_file, index=False)
+            save_rows_to_csv(rows, OUTPUT_COLUMNS, csv_digest_file)
 
             print(f"\n💾 Article data saved to: {csv_digest_file}.")
             print("   This file can be used for further analysis or to regenerate HTML with setting --reuse_article_data (-ra).")
@@ -1838,12 +2316,20 @@ class DigestGenerator:
             #if self.verbose: traceback.print_exc()
             return (-1)
        
-    def save_digest_html(self, html, filename=OUTPUT_HTML_DEFAULT):
-        """Save digest to HTML file; let outer level catch any exceptions since we already validted name """
+    def save_digest_html(self, html_parts, filename=OUTPUT_HTML_DEFAULT):
+        """Save digest to HTML file; let outer level catch any exceptions since we already validted name 
+           html_parts is the list of lines from generate_digest_html (a single string is also fine) """
         output_path = Path(filename)
+        if isinstance(html_parts, str):
+            html_parts = [html_parts]
 
-        with open(output_path, 'w', encoding='utf-8') as f:  # use outer level exception handling
-            f.write(html)
+        # Stream the pieces into a large write buffer instead of building one big string first
+        with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_WRITE_BUFFER_SIZE) as f:  # use outer level exception handling
+            separator = ''
+            for part in html_parts:
+                f.write(separator)
+                f.write(part)
+                separator = '\n'
 
         print(f"\n💾 Digest page saved to: {output_path.absolute()}")
         print(f"\n📋 To use in Substack:")
@@ -1855,10 +2341,10 @@ class DigestGenerator:
 
         return len(self.articles)
 
-def automated_digest(csv_path, days_back, featured_count, include_wildcards, use_daily_average, scoring_method, show_scores, use_Substack_API, verbose, max_retries, match_authors, max_per_author, output_file, csv_digest_file, reuse_article_data=REUSE_ARTICLES_DEFAULT, normalize=NORMALIZE_DEFAULT, temp_folder='', expand_multiple_authors=False, skip_rows=0, max_rows=0, collapse_categories=False, joint_authors=False, expand_featured_for_ties=False):
+def automated_digest(csv_path, days_back, featured_count, include_wildcards, use_daily_average, scoring_method, show_scores, use_Substack_API, verbose, max_retries, match_authors, max_per_author, output_file, csv_digest_file, reuse_article_data=REUSE_ARTICLES_DEFAULT, normalize=NORMALIZE_DEFAULT, temp_folder='', expand_multiple_authors=False, skip_rows=0, max_rows=0, collapse_categories=False, joint_authors=False, expand_featured_for_ties=False, random_seed=None):
     ''' Non-Interactive function for digest generation (so it can be scripted and scheduled) '''
 
-    generator = DigestGenerator(verbose, temp_folder)
+    generator = DigestGenerator(verbose, temp_folder, random_seed)
 
     if reuse_article_data:
         # skip some steps (this lets us run and test the scoring and HTML generation offline)
@@ -1894,7 +2380,7 @@ def automated_digest(csv_path, days_back, featured_count, include_wildcards, use
     print()
 
     # Step 5: Generate digest HTML and CSV and save them
-    # Save the data on the articles to a dataframe, then to CSV (if option selected by user)
+    # Save the data on the articles to CSV (if option selected by user)
     print("\nStep 5: Save Digest")
     print("-" * 80)
 
@@ -1934,12 +2420,12 @@ def automated_digest(csv_path, days_back, featured_count, include_wildcards, use
             print(f"  Category {cat} count={len(categorized[cat])} ")    
 
     # Now the HTML page
-    html = generator.generate_digest_html(
+    html_parts = generator.generate_digest_html(
         joint, featured, wildcards, categorized,
         days_back, scoring_method, show_scores, normalize,
         collapse_categories, joint_authors)
 
-    result = generator.save_digest_html(html, output_file)
+    result = generator.save_digest_html(html_parts, output_file)
 
     return result
 
@@ -1970,6 +2456,25 @@ def set_int_arg(arg_name, arg_value, default_value: int, min_value=None, max_val
 
     return arg_num
 
+# Numeric runstring options: args attribute -> (name for messages, default, min, max), range-checked by set_int_arg
+INT_ARG_SPECS = {
+    'days_back':           ("Number of Days to Look Back",               DEFAULT_DAYS_BACK,      1, MAX_DAYS_BACK),
+    'featured_count':      ("Number of Featured Articles",               DEFAULT_FEATURED_COUNT, 0, MAX_FEATURED_COUNT),
+    'wildcards':           ("Number of Wildcard Picks",                  DEFAULT_WILDCARD_PICKS, 0, MAX_WILDCARD_PICKS),
+    'retries':             ("Max Retries on API calls",                  DEFAULT_RETRY_COUNT,    0, MAX_RETRY_COUNT),
+    'articles_per_author': ("Max Articles Per Author+Newsletter",        DEFAULT_PER_AUTHOR,     0, MAX_PER_AUTHOR),
+    'skip_rows':           ("Rows of Newsletter File To Skip",           0,                      0, 10000),
+    'max_rows':            ("Maximum Rows to Read From Newsletter File", 0,                      0, 10000),
+}
+
+def bounded_int_arg(attr):
+    ''' argparse type= converter for a numeric option in INT_ARG_SPECS: parse it as an int, then range-check it with set_int_arg '''
+    arg_name, default_value, min_value, max_value = INT_ARG_SPECS[attr]
+    def convert(arg_text):
+        return set_int_arg(arg_name, int(arg_text), default_value, min_value, max_value)
+    convert.__name__ = 'int'  # argparse names the type in its message for a non-number ("invalid int value")
+    return convert
+
 def interactive_cli(reuse_article_data=False, verbose=VERBOSE_DEFAULT):
     ''' Get all inputs interactively up front '''
 
@@ -2038,10 +2543,13 @@ def validate_output_file(filename, verbose=VERBOSE_DEFAULT):
 
 INVALID_FOLDER_CHARS = r'[:*?"<>|\[\]&]'  # treat \ and / as valid for folder, since we will treat string as a path & subfolders are potentially ok
 INVALID_FILE_CHARS = r'[\\/:*?"<>|\[\]&]' # replace these in the filename
+INVALID_FOLDER_RE = re.compile(INVALID_FOLDER_CHARS)
+INVALID_FILE_RE = re.compile(INVALID_FILE_CHARS)
 
+@lru_cache(maxsize=4096)  # the same author names (and titles, on reruns) come through repeatedly
 def make_valid_filename (filename):
     ''' change an article title which might have invalid characters in it to a suitable filename '''
-    sanitized = re.sub(INVALID_FILE_CHARS, "_", filename.strip())
+    sanitized = INVALID_FILE_RE.sub("_", filename.strip())
     return sanitized
 
 def validate_output_folder(folder_name, base_path=".", verbose=VERBOSE_DEFAULT) -> str:
@@ -2049,7 +2557,7 @@ def validate_output_folder(folder_name, base_path=".", verbose=VERBOSE_DEFAULT)
     ''' Create a subfolder under current base_path if valid and not existing. (OK if it exists) '''
     output_folder = Path(folder_name)
 
-    if re.search(INVALID_FOLDER_CHARS, folder_name): 
+    if INVALID_FOLDER_RE.search(folder_name): 
         if verbose: print(f"Invalid folder name: {folder_name}")
         return None
 
@@ -2064,29 +2572,38 @@ def validate_output_folder(folder_name, base_path=".", verbose=VERBOSE_DEFAULT)
         #if verbose: traceback.print_exc()
         return None
 
+def save_rows_to_csv(rows, columns, csv_file):
+    ''' Write rows (dicts keyed by column name) to a CSV file through a large file buffer; caller handles exceptions '''
+    # Same layout pandas to_csv gave us: header row, minimal quoting, the platform's line endings
+    with open(csv_file, 'w', encoding='utf-8', newline='', buffering=OUTPUT_WRITE_BUFFER_SIZE) as f:
+        writer = csv.DictWriter(f, fieldnames=columns, lineterminator=os.linesep)
+        writer.writeheader()
+        writer.writerows(rows)
+
 def change_file_extension(base_filepath, new_extension):
     ''' create new filename based on specified filename - assumes filename HAS an extension you want to replace '''
     base_name, _ = os.path.splitext(base_filepath)
     new_file_path = base_name + "." + new_extension
     return new_file_path
 
+YES_NO = ('No', 'Yes')
+
 def yesno (flag: bool):
-    return 'Yes' if flag else 'No'
+    return YES_NO[bool(flag)]
 
-def get_configuration (verbose=VERBOSE_DEFAULT):
-    ''' get_configuration(): Handle interactive mode or scriptable runstring, maybe take input from file in future '''
-    config_dict={}
-    
+@lru_cache(maxsize=1)
+def build_argument_parser():
+    ''' Build the runstring parser once; the options and help text don't change during a run '''
     # 2025-11-13 KJS Runstring options added. If we have them, use them.
     # Allow interactive mode to be an option.
     parser = argparse.ArgumentParser(description="Generate newsletter digest.")
     # Put these in alphabetical order, except for interactive, to make it easier for users to understand the help text
     parser.add_argument("-i", "--interactive", help=f"Use interactive prompting for inputs.", action="store_true")
-    parser.add_argument("-a", "--articles_per_author", help=f"Maximum number of articles to include for each newsletter and author combination. 0=no limit, 1=most recent only, 2-{MAX_PER_AUTHOR} ok. (Substack RSS file max is {MAX_PER_AUTHOR}.) Default={DEFAULT_PER_AUTHOR}.", type=int, default=DEFAULT_PER_AUTHOR) #, choices=range(0,MAX_PER_AUTHOR+1))
-    parser.add_argument("-c", "--csv_path", help=f"Path to CSV file with newsletter list (OR saved article data, with --reuse_article_data Y). Default='{CSV_PATH_DEFAULT}'", default=CSV_PATH_DEFAULT)
+    parser.add_argument("-a", "--articles_per_author", help=f"Maximum number of articles to include for each newsletter and author combination. 0=no limit, 1=most recent only, 2-{MAX_PER_AUTHOR} ok. (Substack RSS file max is {MAX_PER_AUTHOR}.) Default=%(default)s.", type=bounded_int_arg('articles_per_author'), default=DEFAULT_PER_AUTHOR) #, choices=range(0,MAX_PER_AUTHOR+1))
+    parser.add_argument("-c", "--csv_path", help=f"Path to CSV file with newsletter list (OR saved article data, with --reuse_article_data Y). Default='%(default)s'", default=CSV_PATH_DEFAULT)
     parser.add_argument("-cc", "--collapse_categories", help=f"Collapse categories into detail sections in HTML page. Default=No. (Works for HTML page only; all sections will be expanded when pasted into Substack editor)", action="store_true")
-    parser.add_argument("-d", "--days_back", help=f"How many days back to fetch articles. Default={DEFAULT_DAYS_BACK}, min=1.", type=int, default=DEFAULT_DAYS_BACK)
-    parser.add_argument("-f", "--featured_count", help=f"How many articles to feature. Default={DEFAULT_FEATURED_COUNT}, min=0 (none), max={MAX_FEATURED_COUNT}.", type=int, default=DEFAULT_FEATURED_COUNT)
+    parser.add_argument("-d", "--days_back", help=f"How many days back to fetch articles. Default=%(default)s, min=1.", type=bounded_int_arg('days_back'), default=DEFAULT_DAYS_BACK)
+    parser.add_argument("-f", "--featured_count", help=f"How many articles to feature. Default=%(default)s, min=0 (none), max={MAX_FEATURED_COUNT}.", type=bounded_int_arg('featured_count'), default=DEFAULT_FEATURED_COUNT)
     parser.add_argument("-hs", "--hide_scores", help=f"Hide scores on articles outside the Featured and Wildcard sections", action="store_true")
     parser.add_argument("-j", "--joint_authors", help=f"Highlight in a separate section all collaborative articles (jointly authored by two or more people from the newsletter CSV file). Requires -u (use Substack API).", action="store_true")
     parser.add_argument("-nm", "--no_name_match", help=f"Do not use Author column in CSV newsletter file to filter articles (partial matching). Matching is on by default if Author column is in the newsletter file, and has no effect if the cell is blank for a newsletter row. This option disables matching even if the column has names.", action="store_true")
@@ -2095,18 +2612,26 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
     parser.add_argument("-oc", "--output_file_csv", help=f"Output CSV filename for digest article data (e.g., '{OUTPUT_CSV_DEFAULT}'). Default=none. Use '.' for a default filename based on OUTPUT_FOLDER, CSV_PATH filename, settings, and timestamp (if enabled).", default="")
     parser.add_argument("-oh", "--output_file_html", help=f"Output HTML filename (e.g., '{OUTPUT_HTML_DEFAULT}' in interactive mode). Omit or use '.' in runstring for a default name based on OUTPUT_FOLDER, CSV_PATH filename, settings, and timestamp (if enabled).", default="")
     parser.add_argument("-ra", "--reuse_article_data", help=f"Use CSV_PATH file to read article data from an OUTPUT_CSV file saved from a previous run of this tool. Will bypass use of any API calls to read RSS, HTML, or metrics, and will reuse previous scoring calculations. Use this to experiment quickly with different HTML output options or for repeatable testing.", action="store_true")
-    parser.add_argument("-rows", "--max_rows", help=f"Maximum number of rows of newsletter file to read after skipping (default: no limit)", type=int, default=0)    
-    parser.add_argument("-rt", "--retries", help=f"Number of times to retry failed API calls with increasing delays. Default={DEFAULT_RETRY_COUNT}. Retries will be logged as {STOPWATCH_ICON}.", type=int, default=DEFAULT_RETRY_COUNT) #, choices=range(0,MAX_RETRY_COUNT+1))
-    parser.add_argument("-s", "--scoring_choice", help=f"Scoring method: 1=Standard, 2=Daily Average. Default={SCORING_CHOICE_DEFAULT}. Weights: Likes={LIKE_WEIGHT}, Comments={COMMENT_WEIGHT}, Restacks={RESTACK_WEIGHT}, Length={LENGTH_WEIGHT} per 100 words.",default=SCORING_CHOICE_DEFAULT, choices=['1', '2'])   
-    parser.add_argument("-skip", "--skip_rows", help=f"Number of rows of newsletter file to skip (default: none)", type=int, default=0)    
-    parser.add_argument("-t", "--temp_folder", help=f"Subfolder for saving temporary HTML and JSON files (results of API calls), e.g. 'temp'. Default='' (no temp files saved)", default="")
+    parser.add_argument("-rows", "--max_rows", help=f"Maximum number of rows of newsletter file to read after skipping (default: no limit)", type=bounded_int_arg('max_rows'), default=0)    
+    parser.add_argument("-rs", "--random_seed", help=f"Seed for the random wildcard picks, so that rerunning on the same article data (e.g. with -ra) makes the same picks. Default=none (picks vary from run to run).", type=int, default=None)
+    parser.add_argument("-rt", "--retries", help=f"Number of times to retry failed API calls with increasing delays. Default=%(default)s. Retries will be logged as {STOPWATCH_ICON}.", type=bounded_int_arg('retries'), default=DEFAULT_RETRY_COUNT) #, choices=range(0,MAX_RETRY_COUNT+1))
+    parser.add_argument("-s", "--scoring_choice", help=f"Scoring method: 1=Standard, 2=Daily Average. Default=%(default)s. Weights: Likes={LIKE_WEIGHT}, Comments={COMMENT_WEIGHT}, Restacks={RESTACK_WEIGHT}, Length={LENGTH_WEIGHT} per 100 words.",default=SCORING_CHOICE_DEFAULT, choices=['1', '2'])   
+    parser.add_argument("-skip", "--skip_rows", help=f"Number of rows of newsletter file to skip (default: none)", type=bounded_int_arg('skip_rows'), default=0)    
+    parser.add_argument("-t", "--temp_folder", help=f"Subfolder for saving temporary HTML and JSON files (results of API calls), e.g. 'temp'. Responses cached there are reused for up to {API_CACHE_TTL//3600} hours (RSS feeds are rechecked with the server each run). Default='' (no temp files saved)", default="")
     parser.add_argument("-ts", "--timestamp", help=f"Add datetimestamp to the default output file names.", action="store_true")    
     parser.add_argument("-u", "--use_substack_api", help=f"Use Substack API to get engagement metrics. Default is to get metrics from HTML (faster, but restack counts are not available)", action="store_true")
     parser.add_argument("-v", "--verbose", help=f"More detailed outputs while program is running.", action="store_true")
-    parser.add_argument("-w", "--wildcards", help=f"Number of wildcard picks to include. Default={DEFAULT_WILDCARD_PICKS}, min=0 (none), max={MAX_WILDCARD_PICKS}.", type=int, default=DEFAULT_WILDCARD_PICKS)
+    parser.add_argument("-w", "--wildcards", help=f"Number of wildcard picks to include. Default=%(default)s, min=0 (none), max={MAX_WILDCARD_PICKS}.", type=bounded_int_arg('wildcards'), default=DEFAULT_WILDCARD_PICKS)
     parser.add_argument("-xf", "--expand_featured_for_ties", help=f"Expand the Featured section when more than --feature_count articles share the same top score (they're tied).", action="store_true")
     parser.add_argument("-xma", "--expand_multiple_authors", help=f"When an article has multiple authors, expand the article to multiple rows of the digest article CSV (output) file for all authors included in the newsletter input file. Note that multiple authors are currently only detected when using the Substack API (-u option).", action="store_true")
 
+    return parser
+
+def get_configuration (verbose=VERBOSE_DEFAULT, now=None):
+    ''' get_configuration(): Handle interactive mode or scriptable runstring, maybe take input from file in future 
+        now: start time of the run, for timestamped file names (default: the current time) '''
+    config_dict={}
+    
     # Step 1: Configuration
     print("Step 1: Digest Configuration")
     print("-" * 80)
@@ -2114,10 +2639,11 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
 
     result=0
     try:
-        now = datetime.now() # KJS in local time, not UTC, for display and file naming purposes (switch to UTC?)
+        if now is None:
+            now = datetime.now() # KJS in local time, not UTC, for display and file naming purposes (switch to UTC?)
         run_time = now.strftime('%Y%m%dT%H%M')
         
-        args = parser.parse_args()
+        args = build_argument_parser().parse_args()
  
         # Confirm that csv_path file exists; others ok to not exist (can use . for default name)
         csv_path          = args.csv_path.strip()
@@ -2126,13 +2652,15 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
         temp_folder       = args.temp_folder.strip()
         output_folder     = args.output_folder.strip()
 
-        days_back         = set_int_arg("Number of Days to Look Back", args.days_back,      DEFAULT_DAYS_BACK,      1, MAX_DAYS_BACK)
-        featured_count    = set_int_arg("Number of Featured Articles", args.featured_count, DEFAULT_FEATURED_COUNT, 0, MAX_FEATURED_COUNT)
-        include_wildcards = set_int_arg("Number of Wildcard Picks",    args.wildcards,      DEFAULT_WILDCARD_PICKS, 0, MAX_WILDCARD_PICKS)
-        max_retries       = set_int_arg("Max Retries on API calls",    args.retries,        DEFAULT_RETRY_COUNT,    0, MAX_RETRY_COUNT)
-        max_per_author    = set_int_arg("Max Articles Per Author+Newsletter", args.articles_per_author, DEFAULT_PER_AUTHOR, 0, MAX_PER_AUTHOR) 
-        skip_rows         = set_int_arg("Rows of Newsletter File To Skip", args.skip_rows, 0, 0, 10000) 
-        max_rows          = set_int_arg("Maximum Rows to Read From Newsletter File", args.max_rows, 0, 0, 10000) 
+        # The numeric options were range-checked while parsing (see bounded_int_arg)
+        days_back         = args.days_back
+        featured_count    = args.featured_count
+        include_wildcards = args.wildcards
+        max_retries       = args.retries
+        max_per_author    = args.articles_per_author
+        skip_rows         = args.skip_rows
+        max_rows          = args.max_rows
+        random_seed       = args.random_seed
         
         verbose            = args.verbose
         timestamp          = args.timestamp
@@ -2141,6 +2669,7 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
         match_authors      = not args.no_name_match
         show_scores        = not args.hide_scores
         normalize          = not args.no_normalization
+        normalize_text     = yesno(normalize)  # used in the default file names and the summary below
         collapse_categories = args.collapse_categories
         joint_authors       = args.joint_authors
         expand_multiple_authors = args.expand_multiple_authors
@@ -2165,6 +2694,14 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
         use_daily_average = (args.scoring_choice == '2')
         if verbose: print(f"Scoring choice: '{args.scoring_choice}', use_daily_average={use_daily_average}")
 
+        # Prompt first in interactive mode, so the default file names and folder checks below
+        # are done once, with the values the user chose
+        interactive=args.interactive
+        runstring_output_file = output_file  # the -o check below goes by -oh, not the name prompted for (which always has a default)
+        if interactive:
+            # prompt for key settings (not everything)
+            csv_path, days_back, featured_count, include_wildcards, use_daily_average, show_scores, output_file = interactive_cli(reuse_article_data, verbose=verbose)
+
         # KJS file csv_path is dual purpose: It's either a list of newsletters 
         # or a set of previously saved article data.
         # Usage depends on whether reuse_article_data is set to Y.
@@ -2173,28 +2710,25 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
             return -1, config_dict
 
         # Include days_back, scoring method & normalization, and max_per_author in default output filenames
+        # (Work out the optional pieces first, then build the extension in one f-string)
+        timestamp_text = f".{run_time}" if timestamp else ""
         if reuse_article_data:
             print(f"Reusing article data from {csv_path}")
             print(f"Ignoring Days Back, Match Authors, Use Substack API, and Max Retries (not relevant)")
-            default_extension = f"reused_s{2 if use_daily_average else 1}n{yesno(normalize)[0]}"
+            default_extension = f"reused_s{2 if use_daily_average else 1}n{normalize_text[0]}{timestamp_text}"
         else:
             print(f"Reading newsletter data from {csv_path}")
-            # KJS 2025-12-15 Add scoring settings to extension since we now support them in reuse mode
-            default_extension = f"digest{days_back}d_s{2 if use_daily_average else 1}n{yesno(normalize)[0]}_a{max_per_author}"
+            rows_text = ""
             if skip_rows>0 or max_rows>0: 
-                default_extension = default_extension+f"_rows{skip_rows+1}"
-                if max_rows>0: 
-                    default_extension = default_extension+f"-{skip_rows+max_rows}"
-                else:
-                    default_extension = default_extension+"-end"
-
-        if timestamp: default_extension = default_extension+f".{run_time}"
+                rows_text = f"_rows{skip_rows+1}-{skip_rows+max_rows if max_rows>0 else 'end'}"
+            # KJS 2025-12-15 Add scoring settings to extension since we now support them in reuse mode
+            default_extension = f"digest{days_back}d_s{2 if use_daily_average else 1}n{normalize_text[0]}_a{max_per_author}{rows_text}{timestamp_text}"
         
         # Set output folder path to be the same as the input file's folder, if not specified
         # Separate folder path and filename
         input_folder, input_filename = os.path.split(csv_path)
         if len(output_folder)>0: 
-            if len(output_file) >2: 
+            if len(runstring_output_file) >2: 
                 print(f"{WARNING_TRIANGLE_ICON} Warning: Ignoring -o output folder specification for HTML output since -oh filename is specified")
                 output_folder=input_folder
             if len(csv_digest_file) >2:
@@ -2205,23 +2739,21 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
         if not validate_output_folder(output_folder, '.', verbose):
             return -1, config_dict
         output_path = os.path.join(output_folder, input_filename)            
+        output_base, _ = os.path.splitext(output_path)  # both default output names replace the input file's extension
         
         # Set default HTML output filename based on the CSV input name and HTML-specific configuration settings
-        if not output_file or len(output_file) < 5:  
+        if len(output_file) < 5:  # blank, '.', or too short to be a real name
             # use a default name with the feature & wildcard counts
-            output_file = change_file_extension(output_path, default_extension+f".{'j' if joint_authors else ''}f{'x' if expand_featured_for_ties else ''}{featured_count}w{include_wildcards}{'c' if collapse_categories else ''}.html")
+            output_file = f"{output_base}.{default_extension}.{'j' if joint_authors else ''}f{'x' if expand_featured_for_ties else ''}{featured_count}w{include_wildcards}{'c' if collapse_categories else ''}.html"
         
         # Handle CSV filename defaults (updated KJS)
-        if not csv_digest_file or len(csv_digest_file)<1:
+        if not csv_digest_file:
             csv_digest_file = ''        # default is no CSV output file
-        elif len(csv_digest_file)==1 and csv_digest_file[0]=='.':  # create a default name based on input file name
+        elif csv_digest_file == '.':    # create a default name based on input file name
             article_extension = default_extension+("_xma" if expand_multiple_authors else "")
-            csv_digest_file = change_file_extension(output_path, article_extension+".csv")
+            csv_digest_file = f"{output_base}.{article_extension}.csv"
 
-        interactive=args.interactive
         if interactive:
-            # prompt for key settings (not everything)
-            csv_path, days_back, featured_count, include_wildcards, use_daily_average, show_scores, output_file = interactive_cli(reuse_article_data, verbose=verbose)
             print("\nRunning digest generator with defaults and settings from interactive prompts\n")
         else:
             print("\nRunning digest generator with defaults and settings from runstring.")
@@ -2234,7 +2766,8 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
         if len(csv_digest_file) > 0 and not validate_output_file(csv_digest_file, verbose):
             return -1, config_dict
 
-        if len(temp_folder) > 0:
+        # (No need to check the temp folder again if it is the output folder, which was checked and created above)
+        if len(temp_folder) > 0 and os.path.normpath(temp_folder) != os.path.normpath(output_folder):
             if not validate_output_folder(temp_folder, '.', verbose):
                 return -1, config_dict
             #if verbose: print(f"Temp folder {temp_folder} name is ok.")
@@ -2264,28 +2797,32 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
             print()
 
         # These parameters are for generating the HTML and output file, so always show them
-        collab_text=f"{yesno(joint_authors)}"
+        collab_text=yesno(joint_authors)
         feature_text=f"Top {featured_count} based on score" if featured_count>0 else "None"
         wildcard_text=f"{include_wildcards}" if include_wildcards>0 else "None"
-        print(f"\nDigest formatting options:")
-        print(f"  Highlight Jointly Authored Articles: {collab_text}")
-        print(f"  Number of Featured Articles: {feature_text}{' (may be more if there are ties)' if expand_featured_for_ties else ''}")
-        print(f"  Number of Wildcard Articles: {wildcard_text} (may be less)")
-        print(f"  Scoring method? {scoring_method}")
-        print(f"  Normalize scores? {yesno(normalize)}")
-        print(f"  Show scores on non-featured articles? {yesno(show_scores)}")
-
-        print(f"\nOutput file HTML: {output_file}")
+        # Collect the summary lines and print them in one go
+        summary_lines = [
+            f"\nDigest formatting options:",
+            f"  Highlight Jointly Authored Articles: {collab_text}",
+            f"  Number of Featured Articles: {feature_text}{' (may be more if there are ties)' if expand_featured_for_ties else ''}",
+            f"  Number of Wildcard Articles: {wildcard_text} (may be less){f', random seed {random_seed}' if random_seed is not None and include_wildcards>0 else ''}",
+            f"  Scoring method? {scoring_method}",
+            f"  Normalize scores? {normalize_text}",
+            f"  Show scores on non-featured articles? {yesno(show_scores)}",
+            f"\nOutput file HTML: {output_file}",
+        ]
         if len(csv_digest_file)>0: 
-            print(f"Output file CSV: {csv_digest_file}")
-        print()
+            summary_lines.append(f"Output file CSV: {csv_digest_file}")
+        summary_lines.append("")
+        print("\n".join(summary_lines))
 
     except Exception as e:
         print(f"\n{RED_X_FAILURE_ICON}EXCEPTION in configuration setting:\n{e}\n")
         if verbose: traceback.print_exc()
-        return -1
+        return -1, config_dict
 
-    config_dict = {'csv_path': csv_path, 'days_back': days_back, 'featured_count': featured_count, 'include_wildcards': include_wildcards, 'use_daily_average': use_daily_average, 'scoring_method': scoring_method,'show_scores': show_scores, 'use_Substack_API': use_Substack_API, 'verbose': verbose, 'max_retries': max_retries, 'match_authors': match_authors, 'max_per_author': max_per_author, 'output_file': output_file, 'csv_digest_file': csv_digest_file, 'reuse_article_data': reuse_article_data, 'normalize': normalize, 'temp_folder': temp_folder, 'expand_multiple_authors': expand_multiple_authors, 'skip_rows': skip_rows, 'max_rows': max_rows, 'collapse_categories': collapse_categories, 'joint_authors': joint_authors, 'expand_featured_for_ties': expand_featured_for_ties }
+    # Keys must match the parameter names of automated_digest, which main() calls with **config_dict
+    config_dict = {'csv_path': csv_path, 'days_back': days_back, 'featured_count': featured_count, 'include_wildcards': include_wildcards, 'use_daily_average': use_daily_average, 'scoring_method': scoring_method,'show_scores': show_scores, 'use_Substack_API': use_Substack_API, 'verbose': verbose, 'max_retries': max_retries, 'match_authors': match_authors, 'max_per_author': max_per_author, 'output_file': output_file, 'csv_digest_file': csv_digest_file, 'reuse_article_data': reuse_article_data, 'normalize': normalize, 'temp_folder': temp_folder, 'expand_multiple_authors': expand_multiple_authors, 'skip_rows': skip_rows, 'max_rows': max_rows, 'collapse_categories': collapse_categories, 'joint_authors': joint_authors, 'expand_featured_for_ties': expand_featured_for_ties, 'random_seed': random_seed }
     
     return 0, config_dict
 
@@ -2294,8 +2831,9 @@ def get_configuration (verbose=VERBOSE_DEFAULT):
 # Digest Generator
 ########################################################################################
 
-def main():
-    ''' main(): Handle interactive mode or scriptable runstring '''
+def main(start=None):
+    ''' main(): Handle interactive mode or scriptable runstring 
+        start: when the run started (local time), shared with get_configuration for file timestamps '''
     
     print("=" * 80)
     print("📧 Standalone Newsletter Digest Generator") # if you get an encoding error here, set PYTHONIOENCODING=utf_8 in your environment
@@ -2304,23 +2842,15 @@ def main():
 
     verbose=VERBOSE_DEFAULT
     try:
-        result, config_dict = get_configuration()
+        result, config_dict = get_configuration(now=start)
         if result<0:
             print("\n\n{RED_X_FAILURE_ICON}ERROR: Unable to get configuration for running digest processor. Stopping.")
             return result
 
         verbose=config_dict['verbose']
 
-        result=automated_digest (config_dict['csv_path'], config_dict['days_back'], 
-            config_dict['featured_count'],    config_dict['include_wildcards'], 
-            config_dict['use_daily_average'], config_dict['scoring_method'], config_dict['show_scores'], 
-            config_dict['use_Substack_API'],  config_dict['verbose'],        config_dict['max_retries'],
-            config_dict['match_authors'],     config_dict['max_per_author'], config_dict['output_file'], 
-            config_dict['csv_digest_file'],   config_dict['reuse_article_data'], config_dict['normalize'],
-            config_dict['temp_folder'],       config_dict['expand_multiple_authors'],
-            config_dict['skip_rows'],         config_dict['max_rows'],
-            config_dict['collapse_categories'], config_dict['joint_authors'],
-            config_dict['expand_featured_for_ties'])
+        # config_dict keys are the same as the automated_digest parameter names
+        result=automated_digest(**config_dict)
 
         if result >= 0:
             temp_folder=config_dict['temp_folder']
@@ -2338,20 +2868,24 @@ def main():
         return 0
 
     except Exception as e:
-        print(f"\n{RED_X_FAILURE_ICON}EXCEPTION: {e}\n")
-        traceback.print_exc()
+        print(f"\n{RED_X_FAILURE_ICON}EXCEPTION: {type(e).__name__}: {e}\n")
+        if verbose: traceback.print_exc()
         return -1
     
 if __name__ == '__main__':
 
+    # Just asking for help? Let argparse print it and exit, without the banners and configuration steps
+    if any(arg in ('-h', '--help') for arg in sys.argv[1:]):
+        build_argument_parser().parse_args()
+
     date_format='%Y-%m-%d %H:%M'
-    start = datetime.now() # in local time, not UTC, for display purposes
+    start = datetime.now() # in local time, not UTC, for display purposes; also the run time in timestamped file names
     print("\n" + "*" * 80)
     print(f"Digest generator v{DG_VERSION} starting at {start.strftime(date_format)}\n")
     
-    result = main()
+    result = main(start)
     
-    # Note: This will not be executed if there's a runstring error or user requests -h --help. 
+    # Note: This will not be executed if there's a runstring error. (-h --help exits above.)
     now = datetime.now() # in local time, not UTC, for display purposes
     elapsed = now - start
     print(f"\nDigest generator v{DG_VERSION} finished at {now.strftime(date_format)}; execution time {elapsed}")